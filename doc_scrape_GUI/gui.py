@@ -16,11 +16,18 @@ import tkinter as tk
 from urllib.parse import urlparse
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 import json
-from collections import deque
-import glob
+from collections import deque, defaultdict
+from functools import lru_cache
 import time
 from datetime import datetime
 
+# orjson is optional; it makes saving/loading settings faster when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup a file logger for diagnostics
 log_file = os.path.join(os.path.dirname(__file__), "gui_debug.log")
 file_handler = logging.FileHandler(log_file, mode="w", encoding='utf-8')
@@ -39,7 +46,7 @@ if project_root not in sys.path:
 try:
     from document_scraper.crawler import Crawler  # Import the new Crawler component
     from document_scraper.scraper import DocumentationScraper
-    from document_scraper.utils import is_valid_url, ensure_directory_exists
+    from document_scraper.utils import is_valid_url, ensure_directory_exists, url_path
 except ImportError as e:
     # Use tk._default_root to show error if main window isn't up yet
     try:
@@ -82,6 +89,13 @@ if not any(isinstance(h, logging.FileHandler) for h in logger.handlers):
      pass
 
 
+# --- Index Helpers ---
+@lru_cache(maxsize=4096)
+def _section_title(segment):
+    """Turn the first path segment of a URL into an index section title."""
+    return (segment or "General").replace('-', ' ').replace('_', ' ').title()
+
+
 # --- GUI Application Class ---
 class DocScraperApp:
     def __init__(self, root=None):
@@ -115,6 +129,8 @@ class DocScraperApp:
         # --- Variables ---
         self.url = tk.StringVar()
         self.output_dir = tk.StringVar()
+        self._output_dir_abs = os.path.abspath("")  # Absolute form of output_dir, kept current by a trace
+        self.output_dir.trace_add("write", self._on_output_dir_changed)
         self.max_depth = tk.IntVar(value=5)
         self.delay = tk.DoubleVar(value=0.5)
         self.max_pages = tk.IntVar(value=0)  # 0 means unlimited
@@ -141,11 +157,40 @@ class DocScraperApp:
         self.aux_links = []  # To store discovered auxiliary links
         self.external_links = []  # To store discovered external links
         self.asset_links = []  # To store discovered asset links
+        self._last_link_tab_counts = None  # Counts last shown on the link tabs
+        self._pending_links = {}  # Links waiting for their (hidden) listbox to be shown
+        self._listed_links = {}  # Links already shown or queued, per listbox
+        self._active_link_listbox = None  # Listbox the link context menu was opened on
+        self._progress_lock = threading.Lock()
+        self._pending_progress = deque()  # (url, current, total) events from the scraper thread
+        self._pages_count_cached = -1  # Page count currently shown in the status labels
+        self._progress_mode = None  # Progress bar mode for the current run (set by the first event)
+        self._progress_pump = None  # after() id of the scheduled progress pump while a run is active
+        self._run_output_dir = None  # Absolute output directory of the current run
+        self._pages_count = 0  # Rows in the crawled pages list
+        self._page_rows = {}  # URL -> crawled pages list item id
+        self._output_index = None  # (output_dir, {file name: [full paths]}) for find_downloaded_file
+        self._last_time_text = "0:00"  # Elapsed time currently shown on the dashboard
+        self._dashboard_shown = {}  # Dashboard count label -> text currently shown
+        self._dash_counts = (0, 0)  # Latest (pages, assets) passed to update_dashboard_counts
+        self._dash_pending = False  # Whether a coalesced dashboard update is scheduled
+        self._job_count = 0  # Rows in the job history list
 
         # --- History and Settings ---
         self.recent_urls = deque(maxlen=10)
         self.settings_file = os.path.join(script_dir, "scraper_settings.json")
         self.load_settings()  # Load previous settings and history
+        
+        # Settings are written by a background thread so disk I/O stays off the UI thread
+        self._settings_lock = threading.Lock()
+        self._settings_snapshot = None  # Latest settings waiting to be written
+        self._settings_dirty = threading.Event()
+        self._settings_closing = threading.Event()
+        self._settings_writer = threading.Thread(target=self._settings_writer_loop, daemon=True)
+        self._settings_writer.start()
+        self._settings_save_pending = None  # after() id of the debounced settings snapshot
+        if self.is_standalone:
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # --- GUI Layout ---
         self.configure_styles()  # Configure styles before creating widgets
@@ -158,6 +203,8 @@ class DocScraperApp:
         self.presets_dir = os.path.join(script_dir, "presets")
         if not os.path.exists(self.presets_dir):
             os.makedirs(self.presets_dir, exist_ok=True)
+        self.presets_index_file = os.path.join(self.presets_dir, "presets_index.json")
+        self._presets_index = None  # Cached [{"name", "created", "file"}] entries, loaded on first use
 
     def configure_styles(self):
         style = ttk.Style(self.root)
@@ -424,6 +471,8 @@ class DocScraperApp:
         # --- Control Buttons ---
         control_frame = ttk.Frame(main_frame, padding="5 10 5 10", style='TFrame')
         control_frame.grid(row=3, column=0, pady=(10, 0), sticky=tk.EW)
+        self._main_frame = main_frame  # Kept for toggle_advanced_options
+        self._control_frame = control_frame
 
         # Add nested frames to organize buttons
         action_buttons = ttk.Frame(control_frame)
@@ -513,6 +562,7 @@ class DocScraperApp:
         # --- Progress & Log Area ---
         status_frame = ttk.LabelFrame(main_frame, text=" Progress & Logs ", padding="10", style='Section.TFrame')
         status_frame.grid(row=4, column=0, pady=10, sticky=tk.NSEW)  # Row 4 instead of 5
+        self._status_frame = status_frame
         status_frame.columnconfigure(0, weight=1)
         status_frame.rowconfigure(1, weight=1)  # Allow scrolledtext to expand vertically
 
@@ -590,6 +640,7 @@ class DocScraperApp:
         # Create notebook for link categories
         links_notebook = ttk.Notebook(links_frame)
         links_notebook.pack(fill=tk.BOTH, expand=True)
+        self.links_notebook = links_notebook  # Kept for tab count updates
         
         # Documentation links tab
         doc_links_frame = ttk.Frame(links_notebook)
@@ -640,6 +691,13 @@ class DocScraperApp:
         
         # Add links tab to main notebook
         self.notebook.add(links_frame, text="Discovered Links")
+        
+        # Hidden link lists are only filled in once their tab is shown
+        for listbox in (self.doc_links_list, self.aux_links_list, self.ext_links_list, self.asset_links_list):
+            self._pending_links[listbox] = deque()
+            self._listed_links[listbox] = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._flush_visible_link_list)
+        self.links_notebook.bind("<<NotebookTabChanged>>", self._flush_visible_link_list)
 
         self.progress = ttk.Progressbar(status_frame, orient=tk.HORIZONTAL, length=300, mode='determinate')
         self.progress.grid(row=2, column=0, pady=(5,0), sticky=tk.EW)  # Span horizontally
@@ -812,47 +870,84 @@ class DocScraperApp:
         # Add current URL to history
         self.add_to_recent_urls(url)
 
-        # Validate output path before potentially creating it
-        output = os.path.abspath(output)  # Ensure absolute path
-        if not os.path.isdir(os.path.dirname(output)) and os.path.dirname(output) != '':
-             messagebox.showerror("Error", f"Parent directory for '{output}' does not exist.", parent=self.root)
-             return
-
-        if not os.path.exists(output):
-             if messagebox.askyesno("Create Directory?", f"Output directory '{output}' does not exist. Create it?", parent=self.root):
-                 try:
-                     os.makedirs(output, exist_ok=True)
-                     self.log_message(f"Created directory: {output}", logging.INFO)
-                     
-                     # Verify the directory was actually created and is writable
-                     if not os.path.exists(output):
-                         messagebox.showerror("Error", 
-                                            f"Failed to create directory '{output}'. The path may be invalid or you may not have permission.", 
-                                            parent=self.root)
-                         return
-                     
-                     if not os.access(output, os.W_OK):
-                         messagebox.showerror("Permission Error", 
-                                            f"The directory was created but you don't have permission to write to it:\n{output}\n\n"
-                                            "Please choose a different directory or run the application with higher privileges.", 
-                                            parent=self.root)
-                         return
-                 except OSError as e:
-                     messagebox.showerror("Error", f"Could not create directory: {e}", parent=self.root)
-                     return
-             else:
-                 self.log_message("Directory creation cancelled.", logging.WARNING)
-                 return  # User chose not to create
-        elif not os.path.isdir(output):
-             messagebox.showerror("Error", f"Output path '{output}' exists but is not a directory.", parent=self.root)
-             return
-        elif not os.access(output, os.W_OK):
-             messagebox.showerror("Permission Error", 
-                                f"You don't have permission to write to the selected directory:\n{output}\n\n"
-                                "Please choose a different directory or run the application with higher privileges.", 
-                                parent=self.root)
-             return
+        # Validate the output path on a worker thread; the filesystem calls can
+        # stall for a long time on network drives
+        self.start_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Status: Checking output directory...")
+        threading.Thread(target=self._validate_output_dir, args=(url, output, False), daemon=True).start()
+
+    def _validate_output_dir(self, url, output, create):
+        """Check (and optionally create) the output directory off the GUI thread."""
+        error = None
+        try:
+            output = os.path.abspath(output)  # Ensure absolute path
+            parent = os.path.dirname(output)
+            if create:
+                os.makedirs(output, exist_ok=True)
+                self.log_message(f"Created directory: {output}", logging.INFO)
+                
+                # Verify the directory was actually created and is writable
+                if not os.path.exists(output):
+                    result = "create_failed"
+                elif not os.access(output, os.W_OK):
+                    result = "created_not_writable"
+                else:
+                    result = "ok"
+            elif parent != '' and not os.path.isdir(parent):
+                result = "no_parent"
+            elif not os.path.exists(output):
+                result = "missing"
+            elif not os.path.isdir(output):
+                result = "not_dir"
+            elif not os.access(output, os.W_OK):
+                result = "not_writable"
+            else:
+                result = "ok"
+        except OSError as e:
+            result, error = "error", e
+        
+        self.root.after(0, self._on_output_dir_validated, url, output, result, error)
 
+    def _on_output_dir_validated(self, url, output, result, error):
+        """Act on the result of _validate_output_dir back on the GUI thread."""
+        if result == "ok":
+            self._begin_download(url, output)
+            return
+        
+        self.start_button.config(state=tk.NORMAL)
+        self.status_label.config(text="Status: Ready")
+        
+        if result == "missing":
+            if messagebox.askyesno("Create Directory?", f"Output directory '{output}' does not exist. Create it?", parent=self.root):
+                self.start_button.config(state=tk.DISABLED)
+                threading.Thread(target=self._validate_output_dir, args=(url, output, True), daemon=True).start()
+            else:
+                self.log_message("Directory creation cancelled.", logging.WARNING)
+        elif result == "no_parent":
+            messagebox.showerror("Error", f"Parent directory for '{output}' does not exist.", parent=self.root)
+        elif result == "not_dir":
+            messagebox.showerror("Error", f"Output path '{output}' exists but is not a directory.", parent=self.root)
+        elif result == "not_writable":
+            messagebox.showerror("Permission Error", 
+                               f"You don't have permission to write to the selected directory:\n{output}\n\n"
+                               "Please choose a different directory or run the application with higher privileges.", 
+                               parent=self.root)
+        elif result == "create_failed":
+            messagebox.showerror("Error", 
+                               f"Failed to create directory '{output}'. The path may be invalid or you may not have permission.", 
+                               parent=self.root)
+        elif result == "created_not_writable":
+            messagebox.showerror("Permission Error", 
+                               f"The directory was created but you don't have permission to write to it:\n{output}\n\n"
+                               "Please choose a different directory or run the application with higher privileges.", 
+                               parent=self.root)
+        else:
+            messagebox.showerror("Error", f"Could not create directory: {error}", parent=self.root)
+
+    def _begin_download(self, url, output):
+        """Reset the UI and start the scraper thread for a validated output directory."""
+        self._run_output_dir = output  # Already made absolute by _validate_output_dir
+        
         # Disable start button, enable stop button
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -865,23 +960,32 @@ class DocScraperApp:
         # Clear page list
         for item in self.pages_list.get_children():
             self.pages_list.delete(item)
+        self._pages_count = 0
+        self._page_rows.clear()
+        self._output_index = None  # Output files are about to change
         
         # Clear link lists
         self.doc_links_list.delete(0, tk.END)
         self.aux_links_list.delete(0, tk.END)
         self.ext_links_list.delete(0, tk.END)
         self.asset_links_list.delete(0, tk.END)
+        for pending in self._pending_links.values():
+            pending.clear()
+        for listed in self._listed_links.values():
+            listed.clear()
         
         # Reset status labels
         self.pages_count_label.config(text="Pages: 0")
+        self._pages_count_cached = 0
         self.assets_count_label.config(text="Assets: 0")
         self.status_label.config(text="Status: Starting...")
         
         # Reset dashboard
-        self.dashboard_pages_count.config(text="0")
-        self.dashboard_doc_count.config(text="0")
-        self.dashboard_assets_count.config(text="0")
+        self._set_dashboard_label(self.dashboard_pages_count, "0")
+        self._set_dashboard_label(self.dashboard_doc_count, "0")
+        self._set_dashboard_label(self.dashboard_assets_count, "0")
         self.dashboard_time.config(text="0:00")
+        self._last_time_text = "0:00"
         
         # Start timer
         self.start_time = time.time()
@@ -895,6 +999,7 @@ class DocScraperApp:
 
         # Reset and show progress bar
         self.progress['value'] = 0
+        self._progress_mode = None
         self.progress.grid()  # Make progress bar visible
 
         # Save current settings
@@ -938,6 +1043,10 @@ class DocScraperApp:
         # Run scraper in a separate thread
         self.scraper_thread = threading.Thread(target=self.run_scraper, args=(scraper_options,), daemon=True)
         self.scraper_thread.start()
+        
+        # Apply batched progress events while the scraper runs
+        if self._progress_pump is None:
+            self._pump_progress()
 
     def check_browser_mode_dependencies(self):
         """Check if required dependencies for browser mode are installed."""
@@ -1001,9 +1110,9 @@ class DocScraperApp:
             logger.info("Starting scraper with options:")
             for key, value in options.items():
                  if key not in ['cookies', 'proxies'] or value is None:
-                     logger.info(f"  {key}: {value}")
+                     logger.info("  %s: %s", key, value)
                  else:
-                     logger.info(f"  {key}: [REDACTED]")
+                     logger.info("  %s: [REDACTED]", key)
             logger.info("-" * 20)
             
             # Create the scraper
@@ -1061,33 +1170,89 @@ class DocScraperApp:
     def _update_link_list(self, listbox, links):
         """Update a listbox with links on the main thread."""
         # Add new links if they're not already in the list
-        current_links = listbox.get(0, tk.END)
+        listed = self._listed_links[listbox]
+        pending = self._pending_links[listbox]
         for link in links:
-            if link not in current_links:
-                listbox.insert(tk.END, link)
+            if link not in listed:
+                listed.add(link)
+                pending.append(link)
+        
+        # Only render into the listbox the user is actually looking at
+        if self._is_link_list_visible(listbox):
+            self._flush_link_list(listbox)
+    
+    def _is_link_list_visible(self, listbox):
+        """Check whether a link listbox is on the currently selected tabs."""
+        try:
+            return (str(self.notebook.select()) == str(self.links_notebook.master) and
+                    str(self.links_notebook.select()) == str(listbox.master))
+        except tk.TclError:
+            return False
+    
+    def _flush_link_list(self, listbox):
+        """Insert all pending links into a listbox in a single call."""
+        pending = self._pending_links[listbox]
+        if pending:
+            listbox.insert(tk.END, *pending)
+            pending.clear()
+    
+    def _flush_visible_link_list(self, event=None):
+        """Render pending links for whichever link list has just become visible."""
+        for listbox in self._pending_links:
+            if self._is_link_list_visible(listbox):
+                self._flush_link_list(listbox)
+                break
 
     def update_link_tabs(self, doc_count, aux_count, ext_count, asset_count):
         """Update notebook tab texts with counts."""
+        counts = (doc_count, aux_count, ext_count, asset_count)
+        if counts == self._last_link_tab_counts:
+            return  # Nothing changed, avoid reconfiguring the tabs
+        
         try:
-            # Find the links notebook
-            links_notebook = self.notebook.winfo_children()[2].winfo_children()[0]
-            
             # Update tab texts
-            links_notebook.tab(0, text=f"Documentation Links ({doc_count})")
-            links_notebook.tab(1, text=f"Auxiliary Links ({aux_count})")
-            links_notebook.tab(2, text=f"External Links ({ext_count})")
-            links_notebook.tab(3, text=f"Asset Links ({asset_count})")
+            self.links_notebook.tab(0, text=f"Documentation Links ({doc_count})")
+            self.links_notebook.tab(1, text=f"Auxiliary Links ({aux_count})")
+            self.links_notebook.tab(2, text=f"External Links ({ext_count})")
+            self.links_notebook.tab(3, text=f"Asset Links ({asset_count})")
+            self._last_link_tab_counts = counts
         except Exception as e:
             logger.error(f"Error updating link tabs: {e}")
 
     def update_progress_safe(self, url, current, total):
-        """Thread-safe wrapper to schedule progress bar update on GUI thread."""
-        self.root.after(0, self.update_progress, url, current, total)
+        """Thread-safe wrapper to queue a progress update for the GUI thread."""
+        # Events are applied in batches by _pump_progress rather than waking
+        # the mainloop once per page
+        with self._progress_lock:
+            self._pending_progress.append((url, current, total))
+
+    def _pump_progress(self):
+        """Apply queued progress events and schedule the next check while the scraper runs."""
+        # Checked before draining so events queued just before the thread exits are still applied
+        running = self.scraper_thread is not None and self.scraper_thread.is_alive()
+        self._drain_progress()
+        self._progress_pump = self.root.after(50, self._pump_progress) if running else None
+
+    def _drain_progress(self):
+        """Apply all queued progress events with a single widget refresh."""
+        with self._progress_lock:
+            if not self._pending_progress:
+                return
+            events = list(self._pending_progress)
+            self._pending_progress.clear()
+        
+        # Every completed page gets its row; counters only need the latest state
+        for url, _, _ in events[:-1]:
+            if url:
+                self._add_page_to_list(url)
+        self.update_progress(*events[-1])
 
     def update_progress(self, url, current, total):
         """Update progress bar and page list with current scraping status."""
-        # Update status counters
-        self.pages_count_label.config(text=f"Pages: {current}")
+        # Update status counters (only when the number actually changed)
+        if current != self._pages_count_cached:
+            self._pages_count_cached = current
+            self.pages_count_label.config(text=f"Pages: {current}")
         
         # Update main status label with current action/URL
         if url:
@@ -1100,80 +1265,95 @@ class DocScraperApp:
 
         # Add page to the list if it's a new one
         if url:
-            # Get file type and size information (estimated)
-            file_type = "HTML"
-            category = "Unknown"
-            
-            # Determine file type based on URL extension
-            if url.endswith(('.jpg', '.jpeg', '.png', '.gif')):
-                file_type = "Image"
-                category = "Asset"
-            elif url.endswith(('.css')):
-                file_type = "CSS"
-                category = "Asset"
-            elif url.endswith(('.js')):
-                file_type = "JS"
-                category = "Asset"
-            
-            # Try to determine category based on our link lists
-            if url in self.doc_links:
-                category = "Doc"
-            elif url in self.aux_links:
-                category = "Aux"
-            elif url in self.external_links:
-                category = "External"
-            elif url in self.asset_links:
-                category = "Asset"
-            
-            # Estimated size - in a real implementation, you'd get the actual file size
-            size = "?"
-            
-            # Check if URL already exists in the list
-            existing_items = self.pages_list.get_children()
-            for item in existing_items:
-                if self.pages_list.item(item, 'values')[0] == url:
-                    # Update status if already exists
-                    self.pages_list.item(item, values=(url, "Completed", file_type, size, category))
-                    break
-            else:
-                # Add new item if not found
-                self.pages_list.insert('', 'end', values=(url, "Completed", file_type, size, category))
-                # Auto-scroll to the bottom to show latest entries
-                self.pages_list.see(self.pages_list.get_children()[-1])
-                
-                # Update notebook tab to show new page count
-                current_pages = len(self.pages_list.get_children())
-                self.notebook.tab(1, text=f"Crawled Pages ({current_pages})")
+            self._add_page_to_list(url)
         
         # Update progress bar and potentially override status label text
+        # (the mode is only reconfigured when it actually changes; once a total
+        # has been seen the bar stays determinate for the rest of the run)
         if total and total > 0:
+            if self._progress_mode != 'determinate':
+                if self._progress_mode == 'indeterminate':
+                    self.progress.stop()
+                self.progress.config(mode='determinate')
+                self._progress_mode = 'determinate'
             self.progress['maximum'] = total
             self.progress['value'] = current
             # Use the total count status if available, otherwise keep the current URL status
             pct = int((current / total) * 100)
             current_status_text = f"Status: {current}/{total} pages ({pct}%)"
-        else:
+        elif self._progress_mode is None:
             # Handle indeterminate mode if total is unknown
             self.progress.config(mode='indeterminate')
-            if not self.progress.winfo_ismapped():  # Check if already started
-                self.progress.start(10)
+            self.progress.start(10)
+            self._progress_mode = 'indeterminate'
 
         self.status_label.config(text=current_status_text)  # Update status label
         
         # Update dashboard counts too
-        self.dashboard_pages_count.config(text=str(current))
+        self._set_dashboard_label(self.dashboard_pages_count, str(current))
+
+    def _add_page_to_list(self, url):
+        """Add a completed page to the crawled pages list, or update its row."""
+        # Get file type and size information (estimated)
+        file_type = "HTML"
+        category = "Unknown"
+        
+        # Determine file type based on URL extension
+        if url.endswith(('.jpg', '.jpeg', '.png', '.gif')):
+            file_type = "Image"
+            category = "Asset"
+        elif url.endswith(('.css')):
+            file_type = "CSS"
+            category = "Asset"
+        elif url.endswith(('.js')):
+            file_type = "JS"
+            category = "Asset"
+        
+        # Try to determine category based on our link lists
+        if url in self.doc_links:
+            category = "Doc"
+        elif url in self.aux_links:
+            category = "Aux"
+        elif url in self.external_links:
+            category = "External"
+        elif url in self.asset_links:
+            category = "Asset"
+        
+        # Estimated size - in a real implementation, you'd get the actual file size
+        size = "?"
+        
+        # Update the row if the URL is already listed
+        values = (url, "Completed", file_type, size, category)
+        iid = self._page_rows.get(url)
+        if iid is not None:
+            self.pages_list.item(iid, values=values)
+        else:
+            # Add new item if not found
+            iid = self.pages_list.insert('', 'end', values=values)
+            self._page_rows[url] = iid
+            self._pages_count += 1
+            # Auto-scroll to the latest entry unless the user has scrolled up
+            if self.pages_list.yview()[1] >= 0.99:
+                self.pages_list.see(iid)
+            
+            # Update notebook tab to show new page count
+            self.notebook.tab(1, text=f"Crawled Pages ({self._pages_count})")
 
     def download_complete(self, pages, assets, output_dir, included_assets):
         """Handle successful completion of download."""
+        # Apply any progress events still waiting for the next pump
+        self._drain_progress()
+        
         # Calculate elapsed time
         elapsed_time = time.time() - self.start_time if hasattr(self, 'start_time') else 0
+        abs_output = self._run_output_dir or os.path.abspath(output_dir)
         
         # Update dashboard
         self.update_dashboard_counts(pages, assets if included_assets else 0)
         self.add_job_to_history(self.url.get(), pages, assets if included_assets else 0, elapsed_time)
         
         # Update dashboard with link counts
-        self.dashboard_doc_count.config(text=str(len(self.doc_links)))
+        self._set_dashboard_label(self.dashboard_doc_count, str(len(self.doc_links)))
         
         # Switch to the dashboard tab
         self.notebook.select(3)  # Index of dashboard tab
@@ -1186,7 +1366,7 @@ class DocScraperApp:
             self.log_message(f"• Downloaded {assets} assets", logging.INFO)
             self.assets_count_label.config(text=f"Assets: {assets}")
         
-        self.log_message(f"• Saved to {os.path.abspath(output_dir)}", logging.INFO)
+        self.log_message(f"• Saved to {abs_output}", logging.INFO)
         self.log_message(f"• Time elapsed: {int(elapsed_time // 60)}m {int(elapsed_time % 60)}s", logging.INFO)
         
         # Update status with success style
@@ -1199,7 +1379,7 @@ class DocScraperApp:
                          f"- {assets if included_assets else 0} assets downloaded\n"
                          f"- Discovered {len(self.doc_links)} documentation links\n"
                          f"- Time elapsed: {int(elapsed_time // 60)}m {int(elapsed_time % 60)}s\n"
-                         f"- Saved to: {os.path.abspath(output_dir)}\n\n"
+                         f"- Saved to: {abs_output}\n\n"
                          f"Would you like to open the output directory now?", 
                          parent=self.root):
             self.open_output_dir()
@@ -1231,54 +1411,42 @@ class DocScraperApp:
                 self.log_message("Index file already exists, no need to create it", logging.INFO)
                 return
                 
+            # Add the scraped pages from the tree view
+            pages = []
+            for item_id in self.pages_list.get_children():
+                item = self.pages_list.item(item_id)
+                url = item['values'][0]
+                if url:
+                    # Try to extract a title from the URL
+                    title = url.split('/')[-1]
+                    if not title:
+                        title = url
+                    pages.append((url, title, url_path(url)))
+
+            # Organize by sections
+            sections = defaultdict(list)
+            for url, title, page_path in pages:
+                # Determine section based on URL structure
+                path_parts = page_path.split('/', 1)
+                section = _section_title(path_parts[0])
+                # Expected path of the saved file, used for linking
+                expected_path = page_path.replace('/', '-') + ".md"
+                sections[section].append((title, expected_path))
+
             # Create a basic index file if none exists
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write("# Documentation Index\n\n")
-                f.write("This index was automatically generated by Document Scraper after stopping.\n\n")
-                
-                # Add the scraped pages from the tree view
-                pages = []
-                for item_id in self.pages_list.get_children():
-                    item = self.pages_list.item(item_id)
-                    url = item['values'][0]
-                    if url:
-                        # Try to extract a title from the URL
-                        title = url.split('/')[-1]
-                        if not title:
-                            title = url
-                        pages.append((url, title))
-                
-                # Organize by sections
-                sections = {}
-                for url, title in pages:
-                    # Parse URL to determine section
-                    parsed_url = urlparse(url)
-                    path_parts = parsed_url.path.strip('/').split('/')
-                    
-                    # Determine section based on URL structure
-                    section = path_parts[0] if path_parts else "General"
-                    section = section.replace('-', ' ').replace('_', ' ').title()
-                    
-                    if section not in sections:
-                        sections[section] = []
-                    sections[section].append((url, title))
-                
-                # Write each section
-                for section_name, entries in sorted(sections.items()):
-                    f.write(f"## {section_name}\n\n")
-                    for url, title in entries:
-                        # Get the expected path for this file
-                        # Create a simple path for linking
-                        url_path = urlparse(url).path.strip('/')
-                        expected_path = url_path.replace('/', '-') + ".md"
-                        f.write(f"- [{title}]({expected_path})\n")
-                    f.write("\n")
+            # (a large write buffer plus one write per section keeps syscalls to a handful)
+            with open(index_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write("# Documentation Index\n\n"
+                        "This index was automatically generated by Document Scraper after stopping.\n\n")
+                for section_name in sorted(sections):
+                    links = [f"- [{title}]({expected_path})\n" for title, expected_path in sections[section_name]]
+                    f.write(f"## {section_name}\n\n" + "".join(links) + "\n")
             
             self.log_message("Created index file with links to all scraped pages", logging.INFO)
             
             # Open the directory
             if messagebox.askyesno("Scraping Stopped", 
-                                 f"Scraping was stopped. {len(self.pages_list.get_children())} pages were downloaded.\n\n"
+                                 f"Scraping was stopped. {self._pages_count} pages were downloaded.\n\n"
                                  f"Would you like to open the output directory?", 
                                  parent=self.root):
                 self.open_output_dir()
@@ -1355,8 +1523,8 @@ class DocScraperApp:
         
         # Insert links with a limit to avoid overwhelming the dialog
         shown_links = list(aux_links)[:100]  # Limit to 100 links for display
-        for link in shown_links:
-            link_list.insert(tk.END, link)
+        if shown_links:
+            link_list.insert(tk.END, *shown_links)  # One Tcl call for the whole batch
             
         if len(aux_links) > len(shown_links):
             link_list.insert(tk.END, f"... and {len(aux_links) - len(shown_links)} more links")
@@ -1433,10 +1601,14 @@ class DocScraperApp:
             
     def reset_ui_after_run(self):
         """Resets buttons and UI elements after run completes or fails."""
+        self._drain_progress()
+        self._output_index = None  # The run wrote new output files
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.progress.grid_remove()  # Hide progress bar
-        self.progress.stop()  # Stop indeterminate animation if it was running
+        if self._progress_mode == 'indeterminate':
+            self.progress.stop()  # Stop indeterminate animation
+        self._progress_mode = None
         self.stop_event.clear()  # Reset event for the next run
         self.scraper_thread = None  # Clear thread reference
         
@@ -1534,19 +1706,23 @@ Troubleshooting:
             url = self.pages_list.item(selected[0], 'values')[0]
             webbrowser.open(url)
 
+    def _on_output_dir_changed(self, *args):
+        """Recompute the cached absolute output directory when the entry changes."""
+        self._output_dir_abs = os.path.abspath(self.output_dir.get())
+
     def open_selected_file(self, event):
         """Open the selected file when double-clicked."""
         import webbrowser
         selected = self.pages_list.selection()
         if selected:
             url = self.pages_list.item(selected[0], 'values')[0]
-            output_dir = self.output_dir.get()
+            output_dir = self._output_dir_abs if self.output_dir.get() else ""
             
-            # Find the file using the improved method
+            # Find the file using the improved method (paths are already absolute)
             file_path = self.find_downloaded_file(url, output_dir)
             if file_path:
                 self.log_message(f"Opening: {file_path}", logging.INFO)
-                webbrowser.open('file://' + os.path.abspath(file_path))
+                webbrowser.open('file://' + file_path)
             else:
                 # If not found, just open the output directory
                 self.open_output_dir()
@@ -1565,30 +1741,28 @@ Troubleshooting:
             index = listbox.nearest(event.y)
             listbox.selection_clear(0, tk.END)
             listbox.selection_set(index)
+            self._active_link_listbox = listbox
             self.link_context_menu.post(event.x_root, event.y_root)
         except Exception:
             pass
 
     def copy_selected_link(self):
-        """Copy selected link from any of the link lists."""
-        for listbox in [self.doc_links_list, self.aux_links_list, self.ext_links_list, self.asset_links_list]:
-            if listbox.curselection():
-                index = listbox.curselection()[0]
-                url = listbox.get(index)
-                self.root.clipboard_clear()
-                self.root.clipboard_append(url)
-                self.status_label.config(text="URL copied to clipboard")
-                break
+        """Copy the selected link from the list the context menu was opened on."""
+        listbox = self._active_link_listbox
+        selection = listbox.curselection() if listbox else ()
+        if selection:
+            url = listbox.get(selection[0])
+            self.root.clipboard_clear()
+            self.root.clipboard_append(url)
+            self.status_label.config(text="URL copied to clipboard")
 
     def open_selected_link(self):
-        """Open selected link from any of the link lists in browser."""
+        """Open the selected link from the list the context menu was opened on in browser."""
         import webbrowser
-        for listbox in [self.doc_links_list, self.aux_links_list, self.ext_links_list, self.asset_links_list]:
-            if listbox.curselection():
-                index = listbox.curselection()[0]
-                url = listbox.get(index)
-                webbrowser.open(url)
-                break
+        listbox = self._active_link_listbox
+        selection = listbox.curselection() if listbox else ()
+        if selection:
+            webbrowser.open(listbox.get(selection[0]))
 
     def open_output_dir(self):
         """Open the output directory in the default file explorer."""
@@ -1610,9 +1784,25 @@ Troubleshooting:
             # Ensure log queue checking is running before mainloop
             # self.check_log_queue() # Already called in __init__
             self.root.mainloop()
+            self.flush_settings()  # Make sure the last settings change reaches disk
 
     def save_settings(self):
-        """Save current settings to a JSON file for persistence between runs."""
+        """Schedule the current settings to be saved for persistence between runs.
+
+        Calls are debounced for 500 ms so a burst of changes is only
+        snapshotted once.
+        """
+        if self._settings_save_pending:
+            self.root.after_cancel(self._settings_save_pending)
+        self._settings_save_pending = self.root.after(500, self._do_save_settings)
+
+    def _do_save_settings(self):
+        """Queue current settings to be saved to a JSON file.
+
+        The Tk variables are read here on the UI thread; the file itself is
+        written by the settings writer thread (at most every 2 seconds).
+        """
+        self._settings_save_pending = None
         try:
             settings = {
                 "recent_urls": list(self.recent_urls),
@@ -1637,12 +1827,56 @@ Troubleshooting:
                 "verbose": self.verbose.get()
             }
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            with self._settings_lock:
+                self._settings_snapshot = settings
+                self._settings_dirty.set()
+        except Exception as e:
+            logger.error(f"Error saving settings: {e}")
+
+    def _settings_writer_loop(self):
+        """Background loop that writes pending settings every 2 seconds and on shutdown."""
+        while True:
+            closing = self._settings_closing.wait(2.0)
+            if self._settings_dirty.is_set():
+                self._write_settings()
+            if closing:
+                break
+
+    def _write_settings(self):
+        """Atomically write the latest settings snapshot to the settings file."""
+        with self._settings_lock:
+            settings = self._settings_snapshot
+            self._settings_dirty.clear()
+        if settings is None:
+            return
+        
+        try:
+            # Write to a temp file first so a crash never leaves a truncated settings file
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(settings, indent=2).encode('utf-8')
+            tmp_file = self.settings_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
             logger.debug("Settings saved successfully")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
 
+    def flush_settings(self):
+        """Stop the settings writer thread after it has written any pending settings."""
+        if self._settings_save_pending:
+            self.root.after_cancel(self._settings_save_pending)
+            self._do_save_settings()
+        self._settings_closing.set()
+        self._settings_writer.join(timeout=5)
+
+    def _on_close(self):
+        """Save pending settings before the main window is destroyed."""
+        self.flush_settings()
+        self.root.destroy()
+
     def load_settings(self):
         """Load settings from JSON file if it exists."""
         if not os.path.exists(self.settings_file):
@@ -1650,8 +1884,9 @@ Troubleshooting:
             return
         
         try:
-            with open(self.settings_file, 'r') as f:
-                settings = json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                data = f.read()
+            settings = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
                 
             # Load recent URLs
             if "recent_urls" in settings:
@@ -1764,33 +1999,69 @@ Troubleshooting:
             with open(preset_file, 'w') as f:
                 json.dump(settings, f, indent=2)
             
+            # Record the preset in the index, dropping entries whose file has gone missing
+            presets = [entry for entry in self._get_presets_index()
+                       if os.path.exists(os.path.join(self.presets_dir, entry["file"]))]
+            presets.append({"name": preset_name, "created": timestamp, "file": os.path.basename(preset_file)})
+            self._save_presets_index(presets)
+            
             self.log_message(f"Preset '{preset_name}' saved successfully", logging.INFO)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save preset: {e}", parent=self.root)
 
-    def load_preset(self):
-        """Load settings from a saved preset."""
-        # Get list of preset files
-        preset_files = glob.glob(os.path.join(self.presets_dir, "*.json"))
-        if not preset_files:
-            messagebox.showinfo("No Presets", "No saved presets found.", parent=self.root)
-            return
+    def _get_presets_index(self):
+        """Return the cached list of saved presets, reading or rebuilding the index on first use."""
+        if self._presets_index is not None:
+            return self._presets_index
         
-        # Extract names and timestamps
+        try:
+            with open(self.presets_index_file, 'r') as f:
+                self._presets_index = json.load(f)
+        except (OSError, ValueError):
+            # No usable index yet (e.g. presets saved by an older version), so rebuild it
+            self._save_presets_index(self._scan_presets())
+        return self._presets_index
+
+    def _scan_presets(self):
+        """Build preset index entries from the preset file names in the presets directory.
+
+        Preset files are saved as ``{name}_{YYYYmmdd}_{HHMMSS}.json``, so the
+        name and timestamp are parsed from the file name without opening it.
+        """
         presets = []
-        for preset_file in preset_files:
-            try:
-                with open(preset_file, 'r') as f:
-                    data = json.load(f)
-                    name = data.get("name", os.path.basename(preset_file))
-                    created = data.get("created", "Unknown")
-                    presets.append((name, created, preset_file))
-            except:
-                # Skip invalid files
-                continue
-        
+        index_name = os.path.basename(self.presets_index_file)
+        try:
+            with os.scandir(self.presets_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or entry.name == index_name:
+                        continue
+                    stem = entry.name[:-5]
+                    parts = stem.rsplit('_', 2)
+                    if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+                        name, created = parts[0], f"{parts[1]}_{parts[2]}"
+                    else:
+                        name, created = stem, "Unknown"
+                    presets.append({"name": name, "created": created, "file": entry.name})
+        except OSError as e:
+            logger.error(f"Error scanning presets directory: {e}")
+        return presets
+
+    def _save_presets_index(self, presets):
+        """Update the cached preset list and persist it to the presets index file."""
+        self._presets_index = presets
+        try:
+            with open(self.presets_index_file, 'w') as f:
+                json.dump(presets, f, indent=2)
+        except OSError as e:
+            logger.error(f"Error saving presets index: {e}")
+
+    def load_preset(self):
+        """Load settings from a saved preset."""
+        # Get names and timestamps from the presets index
+        presets = [(entry["name"], entry["created"], os.path.join(self.presets_dir, entry["file"]))
+                   for entry in self._get_presets_index()]
         if not presets:
-            messagebox.showinfo("No Presets", "No valid presets found.", parent=self.root)
+            messagebox.showinfo("No Presets", "No saved presets found.", parent=self.root)
             return
         
         # Create a dialog to select a preset
@@ -1821,8 +2092,8 @@ Troubleshooting:
         scrollbar.config(command=preset_list.yview)
         
         # Add presets to listbox
-        for name, created, _ in presets:
-            preset_list.insert(tk.END, f"{name} (Created: {created})")
+        if presets:
+            preset_list.insert(tk.END, *(f"{name} (Created: {created})" for name, created, _ in presets))
         
         # Add selection commands
 
@@ -1842,7 +2113,10 @@ Troubleshooting:
                 name, _, preset_file = presets[idx]
                 if messagebox.askyesno("Delete Preset", f"Are you sure you want to delete preset '{name}'?", parent=preset_dialog):
                     try:
-                        os.remove(preset_file)
+                        if os.path.exists(preset_file):
+                            os.remove(preset_file)
+                        self._save_presets_index([entry for entry in self._get_presets_index()
+                                                  if entry["file"] != os.path.basename(preset_file)])
                         preset_list.delete(idx)
                         del presets[idx]
                         if not presets:  # If no more presets, close dialog
@@ -1904,6 +2178,25 @@ Troubleshooting:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load preset: {e}", parent=self.root)
 
+    def _build_output_index(self, output_dir: str, refresh: bool = False) -> dict:
+        """
+        Index every file under the output directory by name, walking the tree once.
+        
+        Args:
+            output_dir: The output directory
+            refresh: Walk the directory again even if an index for it is cached
+            
+        Returns:
+            Dictionary mapping file names to the full paths of files with that name
+        """
+        if refresh or self._output_index is None or self._output_index[0] != output_dir:
+            index = {}
+            for root, _, files in os.walk(output_dir):
+                for name in files:
+                    index.setdefault(name, []).append(os.path.join(root, name))
+            self._output_index = (output_dir, index)
+        return self._output_index[1]
+
     def find_downloaded_file(self, url: str, output_dir: str) -> str:
         """
         Find a downloaded file based on the URL.
@@ -1918,6 +2211,35 @@ Troubleshooting:
         if not output_dir or not os.path.exists(output_dir):
             return None
         
+        # All lookups go through the file index instead of stat'ing candidates
+        cached = self._output_index is not None and self._output_index[0] == output_dir
+        file_path = self._match_downloaded_file(url, output_dir, self._build_output_index(output_dir))
+        if file_path is None and cached:
+            # The cached index may predate pages written since (e.g. while a crawl is running)
+            file_path = self._match_downloaded_file(
+                url, output_dir, self._build_output_index(output_dir, refresh=True))
+        
+        # If all else fails, return the output dir to let the user find the file
+        return file_path or output_dir
+
+    def _match_downloaded_file(self, url: str, output_dir: str, output_index: dict) -> str:
+        """
+        Look up the downloaded file for a URL in an output file index.
+        
+        Args:
+            url: The URL of the file
+            output_dir: The output directory
+            output_index: File index from _build_output_index
+            
+        Returns:
+            The path to the downloaded file, or None if it is not in the index
+        """
+        # Try the deterministic name used by the generated index first
+        primary_name = (url_path(url).replace('/', '-') or 'index') + '.md'
+        primary = os.path.join(output_dir, primary_name)
+        if primary in output_index.get(primary_name, ()):
+            return primary
+        
         # Extract path components from URL
         url_parts = urlparse(url)
         path = url_parts.path.strip('/')
@@ -1936,41 +2258,57 @@ Troubleshooting:
             potential_names.append(url_parts.netloc.split('.')[0])
             potential_names.append('index')
         
+        # Directories to search: the output directory itself (direct file), then
+        # directories based on path components, deepest first
+        search_dirs = [output_dir] + [os.path.join(output_dir, *segments[:i])
+                                      for i in range(len(segments) - 1, 0, -1)]
+        
         # Try with different extensions
         for base_name in potential_names:
             for ext in ['.md', '.html', '.txt', '.json']:
-                # Try direct file
-                direct_file = os.path.join(output_dir, base_name + ext)
-                if os.path.exists(direct_file):
-                    return direct_file
-                
-                # Try directories based on path components
-                for i in range(len(segments) - 1, -1, -1):
-                    # Create paths of increasing depth
-                    path_part = os.path.join(*segments[:i]) if i > 0 else ''
-                    file_path = os.path.join(output_dir, path_part, base_name + ext)
-                    if os.path.exists(file_path):
+                name = base_name + ext
+                found = output_index.get(name)
+                if not found:
+                    continue
+                for dir_path in search_dirs:
+                    file_path = os.path.join(dir_path, name)
+                    if file_path in found:
                         return file_path
         
-        # If all else fails, return the output dir to let the user find the file
-        return output_dir
+        return None
 
     def update_dashboard_timer(self):
         """Update the elapsed time display during scraping."""
         if hasattr(self, 'start_time') and self.scraper_thread and self.scraper_thread.is_alive():
-            elapsed = time.time() - self.start_time
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
-            self.dashboard_time.config(text=f"{minutes}:{seconds:02d}")
+            minutes, seconds = divmod(int(time.time() - self.start_time), 60)
+            text = f"{minutes}:{seconds:02d}"
+            if text != self._last_time_text:
+                self.dashboard_time.config(text=text)
+                self._last_time_text = text
             # Schedule next update in 1 second
             self.root.after(1000, self.update_dashboard_timer)
 
     def update_dashboard_counts(self, pages, assets):
-        """Update the dashboard counts."""
-        self.dashboard_pages_count.config(text=str(pages))
-        self.dashboard_assets_count.config(text=str(assets))
+        """Update the dashboard counts (coalesced into one update per idle cycle)."""
+        self._dash_counts = (pages, assets)
+        if not self._dash_pending:
+            self._dash_pending = True
+            self.root.after_idle(self._apply_dashboard_counts)
+
+    def _apply_dashboard_counts(self):
+        """Show the latest dashboard counts, touching only labels whose value changed."""
+        self._dash_pending = False
+        pages, assets = self._dash_counts
+        self._set_dashboard_label(self.dashboard_pages_count, str(pages))
+        self._set_dashboard_label(self.dashboard_assets_count, str(assets))
         # Update doc links count based on current doc links list
-        self.dashboard_doc_count.config(text=str(len(self.doc_links)))
+        self._set_dashboard_label(self.dashboard_doc_count, str(len(self.doc_links)))
+
+    def _set_dashboard_label(self, label, text):
+        """Set a dashboard count label's text, skipping the Tk call if it is unchanged."""
+        if self._dashboard_shown.get(label) != text:
+            label.config(text=text)
+            self._dashboard_shown[label] = text
 
     def add_job_to_history(self, url, pages, assets, elapsed_time):
         """Add a completed job to the history list."""
@@ -1980,13 +2318,14 @@ Troubleshooting:
         time_str = f"{minutes}:{seconds:02d}"
         
         self.jobs_list.insert('', 0, values=(date_str, url, pages, assets, time_str))
+        self._job_count += 1
         
         # Keep only the most recent 50 jobs
-        items = self.jobs_list.get_children()
-        if len(items) > 50:
-            for i in items[50:]:
-                self.jobs_list.delete(i)
-                
+        if self._job_count > 50:
+            items = self.jobs_list.get_children()
+            self.jobs_list.delete(*items[50:])
+            self._job_count = 50
+
     def toggle_advanced_options(self):
         """Show or hide the advanced configuration sections."""
         if self.advanced_options_visible.get():
@@ -1999,9 +2338,10 @@ Troubleshooting:
             logger.debug("Advanced options hidden")
             
             # Move control and status frames up
-            main_frame = self.container.winfo_children()[0]
-            main_frame.grid_rowconfigure(3, weight=0)  # control_frame row
-            main_frame.grid_rowconfigure(4, weight=1)  # status_frame row
+            self._main_frame.grid_rowconfigure(6, weight=0)
+            self._main_frame.grid_rowconfigure(4, weight=1)  # status_frame row
+            self._control_frame.grid(row=3)
+            self._status_frame.grid(row=4)
         else:
             # Show sections
             self.adv_frame.grid(row=3, column=0, pady=10, sticky=tk.EW)
@@ -2012,12 +2352,7 @@ Troubleshooting:
             logger.debug("Advanced options shown")
             
             # Move control and status frames down
-            main_frame = self.container.winfo_children()[0]
-            main_frame.grid_rowconfigure(5, weight=0)  # Updated control_frame row
-            main_frame.grid_rowconfigure(6, weight=1)  # Updated status_frame row
-            # Update grid positions
-            control_frame_idx = [i for i, child in enumerate(main_frame.winfo_children()) 
-                                if isinstance(child, ttk.Frame) and child.winfo_class() == 'TFrame'][0]
-            status_frame_idx = control_frame_idx + 1
-            main_frame.winfo_children()[control_frame_idx].grid(row=5)
-            main_frame.winfo_children()[status_frame_idx].grid(row=6)
\ No newline at end of file
+            self._main_frame.grid_rowconfigure(4, weight=0)  # Now the filter_frame row
+            self._main_frame.grid_rowconfigure(6, weight=1)  # Updated status_frame row
+            self._control_frame.grid(row=5)
+            self._status_frame.grid(row=6)
\ No newline at end of file
@@ -14,7 +14,7 @@ import argparse
 import traceback
 import logging
 import importlib.util
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, List, Set, Tuple, Optional, Union, Any
 
 # Configure basic logging for standalone operation
 logging.basicConfig(
@@ -39,6 +39,49 @@ OPTIONAL_DEPENDENCIES = {
     "lxml": "Recommended for improved HTML parsing"
 }
 
+# Modules already reported as missing, so repeated checks don't log them again
+_known_missing: Set[str] = set()
+
+# Platform-specific tkinter installation instructions (keyed by sys.platform, "linux" for all Linux variants)
+_TKINTER_INSTRUCTIONS = {
+    "linux": (
+        "\nFor Debian/Ubuntu based systems:\n"
+        "  sudo apt-get update\n"
+        "  sudo apt-get install python3-tk\n"
+        "\nFor Red Hat/Fedora based systems:\n"
+        "  sudo dnf install python3-tkinter"
+    ),
+    "darwin": (
+        "\nFor macOS (using Homebrew):\n"
+        "  brew install python-tk\n"
+        "\nAlternatively, install the official Python installer from python.org\n"
+        "which includes tkinter by default."
+    ),
+    "win32": (
+        "\nFor Windows:\n"
+        "  1. Download the official Python installer from python.org\n"
+        "  2. During installation, ensure 'tcl/tk and IDLE' is selected\n"
+        "  3. If Python is already installed, consider reinstalling with this option"
+    ),
+}
+
+def _report_missing(module_name: str, description: str, critical: bool) -> None:
+    """
+    Log a missing dependency, once per module.
+    
+    Args:
+        module_name: Name of the missing module
+        description: What the module is used for
+        critical: Whether the GUI cannot run without it
+    """
+    if module_name in _known_missing:
+        return
+    _known_missing.add(module_name)
+    if critical:
+        logger.error(f"Critical dependency missing: {module_name} - {description}")
+    else:
+        logger.warning(f"Optional dependency missing: {module_name} - {description}")
+
 def check_dependencies(install_missing: bool = False) -> Tuple[bool, Dict[str, bool], Dict[str, bool]]:
     """
     Verify that all required dependencies are available.
@@ -52,12 +95,20 @@ def check_dependencies(install_missing: bool = False) -> Tuple[bool, Dict[str, b
         - Dictionary of core dependency status
         - Dictionary of optional dependency status
     """
+    # Warm path: every core dependency has already been imported
+    if not install_missing and all(module_name in sys.modules for module_name in CORE_DEPENDENCIES):
+        return True, dict.fromkeys(CORE_DEPENDENCIES, True), check_optional_dependencies()
+    
     core_status = {}
-    optional_status = {}
     all_core_available = True
     
     # Check core dependencies
     for module_name, description in CORE_DEPENDENCIES.items():
+        # Modules that are already imported need no further probing
+        if module_name in sys.modules:
+            core_status[module_name] = True
+            continue
+        
         # Handle the tkinter special case
         if module_name == "tkinter":
             try:
@@ -66,43 +117,54 @@ def check_dependencies(install_missing: bool = False) -> Tuple[bool, Dict[str, b
             except ImportError:
                 core_status[module_name] = False
                 all_core_available = False
-                logger.error(f"Critical dependency missing: {module_name} - {description}")
+                _report_missing(module_name, description, critical=True)
         else:
-            # Handle document_scraper components
-            parts = module_name.split('.')
+            # Handle document_scraper components (find_spec locates the module without running it)
             try:
-                if len(parts) > 1:
-                    # Try importing the specific module
-                    parent = __import__(parts[0], fromlist=[parts[1]])
-                    getattr(parent, parts[1])
-                    core_status[module_name] = True
-                else:
-                    # Regular single module import
-                    importlib.import_module(module_name)
-                    core_status[module_name] = True
-            except (ImportError, AttributeError):
+                core_status[module_name] = importlib.util.find_spec(module_name) is not None
+            except (ImportError, ValueError):
                 core_status[module_name] = False
+            if not core_status[module_name]:
                 all_core_available = False
-                logger.error(f"Critical dependency missing: {module_name} - {description}")
+                _report_missing(module_name, description, critical=True)
                 
     # Check optional dependencies
-    for module_name, description in OPTIONAL_DEPENDENCIES.items():
-        try:
-            importlib.import_module(module_name)
-            optional_status[module_name] = True
-        except ImportError:
-            optional_status[module_name] = False
-            logger.warning(f"Optional dependency missing: {module_name} - {description}")
+    optional_status = check_optional_dependencies()
     
     # Install missing dependencies if requested
     if install_missing and (not all_core_available or False in optional_status.values()):
-        install_dependencies(core_status, optional_status)
-        # Re-check after installation
-        return check_dependencies(install_missing=False)
+        _, newly_available = install_dependencies(core_status, optional_status)
+        # Merge in the modules found after installation instead of re-running every check
+        for module_name in newly_available:
+            if module_name in core_status:
+                core_status[module_name] = True
+            else:
+                optional_status[module_name] = True
+        all_core_available = all(core_status.values())
     
     return all_core_available, core_status, optional_status
 
-def install_dependencies(core_status: Dict[str, bool], optional_status: Dict[str, bool]) -> bool:
+def check_optional_dependencies() -> Dict[str, bool]:
+    """
+    Check which optional dependencies are available.
+    
+    Returns:
+        Dictionary of optional dependency status
+    """
+    optional_status = {}
+    for module_name, description in OPTIONAL_DEPENDENCIES.items():
+        if module_name in sys.modules:
+            optional_status[module_name] = True
+            continue
+        try:
+            optional_status[module_name] = importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            optional_status[module_name] = False
+        if not optional_status[module_name]:
+            _report_missing(module_name, description, critical=False)
+    return optional_status
+
+def install_dependencies(core_status: Dict[str, bool], optional_status: Dict[str, bool]) -> Tuple[bool, Set[str]]:
     """
     Attempt to install missing dependencies.
     
@@ -111,7 +173,9 @@ def install_dependencies(core_status: Dict[str, bool], optional_status: Dict[str
         optional_status: Dictionary of optional dependency status
         
     Returns:
-        Success status of installation attempts
+        Tuple containing:
+        - Success status of installation attempts
+        - Names of previously missing modules that can now be found
     """
     try:
         import subprocess
@@ -143,7 +207,7 @@ def install_dependencies(core_status: Dict[str, bool], optional_status: Dict[str
             try:
                 subprocess.check_call([sys.executable, "-m", "pip", "install"] + to_install)
                 logger.info("Dependencies installed successfully using pip module")
-                return True
+                success = True
             except subprocess.CalledProcessError:
                 logger.warning("Failed to install using pip module, trying pip directly...")
                 
@@ -151,16 +215,31 @@ def install_dependencies(core_status: Dict[str, bool], optional_status: Dict[str
                 try:
                     subprocess.check_call(["pip", "install"] + to_install)
                     logger.info("Dependencies installed successfully using pip")
-                    return True
+                    success = True
                 except subprocess.CalledProcessError:
                     logger.error("Failed to install dependencies using pip")
-                    return False
-        
-        return True  # No dependencies needed installation
+                    success = False
+        else:
+            return True, set()  # No dependencies needed installation
         
     except Exception as e:
         logger.error(f"Error installing dependencies: {e}")
-        return False
+        return False, set()
+    
+    # Probe only the modules that were missing (some may have been installed even if pip failed)
+    importlib.invalidate_caches()
+    newly_available = set()
+    for status in (core_status, optional_status):
+        for module_name, available in status.items():
+            if available or module_name == "tkinter":
+                continue
+            try:
+                if importlib.util.find_spec(module_name) is not None:
+                    newly_available.add(module_name)
+            except (ImportError, ValueError):
+                pass
+    
+    return success, newly_available
 
 def handle_tkinter_missing() -> None:
     """
@@ -172,22 +251,10 @@ def handle_tkinter_missing() -> None:
     print("\ntkinter is required for the Document Scraper GUI.")
     print("\nInstallation instructions:")
     
-    if sys.platform.startswith('linux'):
-        print("\nFor Debian/Ubuntu based systems:")
-        print("  sudo apt-get update")
-        print("  sudo apt-get install python3-tk")
-        print("\nFor Red Hat/Fedora based systems:")
-        print("  sudo dnf install python3-tkinter")
-    elif sys.platform == 'darwin':
-        print("\nFor macOS (using Homebrew):")
-        print("  brew install python-tk")
-        print("\nAlternatively, install the official Python installer from python.org")
-        print("which includes tkinter by default.")
-    elif sys.platform == 'win32':
-        print("\nFor Windows:")
-        print("  1. Download the official Python installer from python.org")
-        print("  2. During installation, ensure 'tcl/tk and IDLE' is selected")
-        print("  3. If Python is already installed, consider reinstalling with this option")
+    platform_key = "linux" if sys.platform.startswith('linux') else sys.platform
+    instructions = _TKINTER_INSTRUCTIONS.get(platform_key)
+    if instructions:
+        print(instructions)
     
     print("\nAfter installing tkinter, run this program again.")
     print("=" * 60)
@@ -205,27 +272,30 @@ def configure_import_paths() -> bool:
         # Get the current script directory
         script_dir = os.path.dirname(os.path.abspath(__file__))
         
+        # Snapshot sys.path once for membership checks
+        path_set = set(sys.path)
+        
         # Add the project root to path (parent of script directory)
         project_root = os.path.dirname(script_dir)
-        if project_root not in sys.path:
+        if project_root not in path_set:
             sys.path.insert(0, project_root)
+            path_set.add(project_root)
             logger.debug(f"Added to sys.path: {project_root}")
         
-        # Ensure the document_scraper package is importable
-        try:
-            import document_scraper
+        # Ensure the document_scraper package is importable (find_spec doesn't run its __init__)
+        if importlib.util.find_spec("document_scraper") is not None:
             logger.debug("document_scraper package is importable")
-        except ImportError:
+        else:
             # Try adding parent directory if package not found
             parent_dir = os.path.dirname(project_root)
-            if parent_dir not in sys.path:
+            if parent_dir not in path_set:
                 sys.path.insert(0, parent_dir)
+                path_set.add(parent_dir)
                 logger.debug(f"Added to sys.path: {parent_dir}")
                 
-            try:
-                import document_scraper
+            if importlib.util.find_spec("document_scraper") is not None:
                 logger.debug("document_scraper package is now importable")
-            except ImportError:
+            else:
                 logger.error("Could not import document_scraper package")
                 return False
         
@@ -235,7 +305,7 @@ def configure_import_paths() -> bool:
             logger.error(f"GUI directory not found at {gui_path}")
             return False
             
-        if gui_path not in sys.path:
+        if gui_path not in path_set:
             sys.path.insert(0, gui_path)
             logger.debug(f"Added to sys.path: {gui_path}")
         
@@ -256,13 +326,15 @@ def create_init_file_if_missing() -> None:
         project_root = os.path.dirname(script_dir)
         gui_path = os.path.join(project_root, "doc_scrape_GUI")
         
-        if os.path.exists(gui_path):
-            init_file = os.path.join(gui_path, "__init__.py")
-            if not os.path.exists(init_file):
-                logger.info(f"Creating missing __init__.py in {gui_path}")
-                
-                with open(init_file, 'w') as f:
-                    f.write('"""GUI package for document_scraper."""\n\n__version__ = "0.3.0"\n')
+        init_file = os.path.join(gui_path, "__init__.py")
+        
+        # Exclusive create: a single open() both checks for and creates the file
+        try:
+            with open(init_file, 'x') as f:
+                f.write('"""GUI package for document_scraper."""\n\n__version__ = "0.3.0"\n')
+            logger.info(f"Created missing __init__.py in {gui_path}")
+        except (FileExistsError, FileNotFoundError):
+            pass  # Already present, or there is no GUI directory to put it in
     except Exception as e:
         logger.warning(f"Error creating __init__.py file: {e}")
         # Non-critical error, continue execution
@@ -301,7 +373,9 @@ def start_gui(debug_mode: bool = False) -> int:
             return 1
         
         # Create a splash screen for better user experience
-        if debug_mode:
+        # (opt-in, since it costs a second Tk root before the app creates its own)
+        show_splash = debug_mode and bool(os.environ.get("DOCSCRAPER_SPLASH"))
+        if show_splash:
             import tkinter as tk
             splash = tk.Tk()
             splash.title("DocScraper Starting")
@@ -323,7 +397,7 @@ def start_gui(debug_mode: bool = False) -> int:
         app = DocScraperApp()
         
         # Close splash screen if it exists
-        if debug_mode and 'splash' in locals():
+        if show_splash:
             splash.destroy()
         
         # Start the main event loop
@@ -385,10 +459,7 @@ def main() -> int:
             
             if not args.install_deps:
                 print("\nTip: Run with --install-deps to automatically install these dependencies.")
-            
-            # Add a slight delay to ensure message is read
-            import time
-            time.sleep(2)
+            # (no pause needed: the warnings stay in the terminal while the GUI loads)
         
         # Start the GUI
         return start_gui(debug_mode=args.debug)
@@ -8,19 +8,20 @@ selective downloading, and interactive content exploration.
 """
 import os
 import sys
-import time
 import click
 import logging
-import requests
-import colorama
 import webbrowser
 import subprocess
-import threading
 from datetime import datetime
-from tqdm import tqdm
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Any, Union, Tuple, Set
-from urllib.parse import urlparse, urljoin
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Any, Union, Tuple, Set, TYPE_CHECKING
+from urllib.parse import urlsplit, SplitResult
+
+if TYPE_CHECKING:
+    import requests
+    from tqdm import tqdm
 
 # Enhanced import handling for both direct and package execution
 try:
@@ -29,14 +30,14 @@ try:
         from .utils import (
             is_valid_url,
             validate_url, 
+            validate_patterns,
             setup_logging,
             prompt_documentation_selection,
             discover_documentation_sections,
             analyze_documentation_structure,
-            categorize_url
+            categorize_url,
+            create_session
         )
-        from .crawler import Crawler
-        from .scraper import DocumentationScraper
     else:
         # Direct execution mode - add project root to path
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -45,35 +46,93 @@ try:
         from document_scraper.utils import (
             is_valid_url,
             validate_url, 
+            validate_patterns,
             setup_logging,
             prompt_documentation_selection,
             discover_documentation_sections,
             analyze_documentation_structure,
-            categorize_url
+            categorize_url,
+            create_session
         )
-        from document_scraper.crawler import Crawler
-        from document_scraper.scraper import DocumentationScraper
 except ImportError as e:
     print(f"Import error: {str(e)}")
     raise
 
-# Initialize colorama for cross-platform color support
-colorama.init()
-
 # Configure logging
 logger = logging.getLogger("document_scraper")
 
+# Pre-styled messages for the download command
+_HDR_CONFIG = click.style("\n✨ Scraper Configuration:", fg="bright_blue")
+_HDR_ADVANCED = click.style("\nAdvanced Options:", fg="bright_blue")
+_MSG_ANALYZING = click.style("\n🔍 Analyzing documentation structure...", fg="bright_yellow")
+_MSG_NO_SECTIONS = click.style("\n❌ No sections selected. Aborting.", fg="red")
+_MSG_WITH_AUX = click.style("✓ Including auxiliary content", fg="green")
+_MSG_DOCS_ONLY = click.style("✓ Downloading documentation content only", fg="green")
+_MSG_STARTING = click.style("\n📥 Starting documentation download...", fg="bright_blue")
+_MSG_COMPLETED = click.style("\n✅ Download Completed!", fg="bright_green")
+_MSG_INTERRUPTED = click.style("\n⚠️ Download interrupted by user", fg="yellow")
+_MSG_SAVED = click.style("✓ Saved downloaded content", fg="green")
+
+# Banner and usage lines shown when no subcommand is given
+_BANNER = click.style(r"""
+  ____             _____                                 
+ |  _ \  ___   ___|___ / _ __  ___ ___  ___ _ __ ___ 
+ | | | |/ _ \ / __| |_ \| '__\/ __/ __|/ __| '__/ _ \
+ | |_| | (_) | (__ ___) | |  \__ \__ \ (__| | |  __/
+ |____/ \___/ \___|____/|_|  |___/___/\___|_|  \___|
+""", fg="bright_blue")
+_TAGLINE = click.style("Documentation Scraper v0.3 - Interactive Mode\n", fg="bright_green")
+_USAGE_LINES = "\n".join([
+    click.style("  docscraper download", fg="bright_green") + " - Interactive documentation download",
+    click.style("  docscraper discover", fg="bright_yellow") + " - Preview available documentation sections",
+    click.style("  docscraper gui", fg="bright_cyan") + " - Launch the graphical user interface",
+    click.style("  docscraper --help", fg="bright_white") + " - Show all available options",
+])
+
 #---------------------------------------------------------------------------
 # Interactive Workflow Functions
 #---------------------------------------------------------------------------
 
-def explore_documentation_structure(url: str, verbose: bool = False) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def _split(url: str) -> SplitResult:
+    """
+    Split a URL once; only path and netloc are needed here, so urlsplit suffices.
+    
+    Args:
+        url: URL to split
+        
+    Returns:
+        Cached urlsplit result
+    """
+    return urlsplit(url)
+
+def _lazy_scraper():
+    """
+    Import the crawler and scraper classes on first use.
+    
+    They pull in Selenium and the conversion stack, which the banner, help
+    and gui paths never need.
+    
+    Returns:
+        Tuple of (Crawler, DocumentationScraper) classes
+    """
+    if __package__ or "." in __name__:
+        from .crawler import Crawler
+        from .scraper import DocumentationScraper
+    else:
+        from document_scraper.crawler import Crawler
+        from document_scraper.scraper import DocumentationScraper
+    return Crawler, DocumentationScraper
+
+def explore_documentation_structure(url: str, verbose: bool = False,
+                                    session: Optional["requests.Session"] = None) -> Dict[str, Any]:
     """
     Perform a comprehensive analysis of documentation structure.
     
     Args:
         url: The URL to analyze
         verbose: Whether to enable verbose logging
+        session: Shared HTTP session so exploration and download reuse connections
         
     Returns:
         Dictionary with analysis results including categorized links
@@ -81,6 +140,7 @@ def explore_documentation_structure(url: str, verbose: bool = False) -> Dict[str
     logger.info(f"Exploring documentation structure at {url}")
     
     # Create a crawler instance configured for exploration mode
+    Crawler, _ = _lazy_scraper()
     crawler = Crawler(
         base_url=url,
         max_depth=1,
@@ -88,7 +148,8 @@ def explore_documentation_structure(url: str, verbose: bool = False) -> Dict[str
         concurrent_requests=3,
         browser_mode=True,  # Enable browser mode for better JavaScript handling
         timeout=30,
-        retries=2
+        retries=2,
+        session=session
     )
     
     # Get initial page content and links
@@ -101,12 +162,10 @@ def explore_documentation_structure(url: str, verbose: bool = False) -> Dict[str
             "message": "Failed to retrieve content"
         }
     
-    # Extract and categorize links
+    # Extract and categorize links, dropping repeats while keeping page order
     categorized_links = {
-        "doc": links.get("doc", []),
-        "aux": links.get("aux", []),
-        "external": links.get("external", []),
-        "asset": links.get("asset", [])
+        category: list(dict.fromkeys(links.get(category, [])))
+        for category in ("doc", "aux", "external", "asset")
     }
     
     # Analyze documentation structure
@@ -132,36 +191,27 @@ def explore_documentation_structure(url: str, verbose: bool = False) -> Dict[str
     
     return result
 
-def select_documentation_sections(structure: Dict[str, Any]) -> List[str]:
+def select_documentation_sections(doc_links: List[str], aux_links: List[str]) -> List[str]:
     """
     Present the documentation structure and allow selection of sections.
     
     Args:
-        structure: Result from explore_documentation_structure
+        doc_links: Documentation links found by explore_documentation_structure
+        aux_links: Auxiliary links found by explore_documentation_structure
         
     Returns:
         List of selected section URLs
     """
     click.echo(click.style("\nDocumentation Structure:", fg="bright_blue"))
     
-    # Get categorized links
-    doc_links = structure.get("links", {}).get("doc", [])
-    aux_links = structure.get("links", {}).get("aux", [])
-    
     # Display documentation sections
-    sections = {}
+    sections = defaultdict(list)
     section_idx = 1
     
-    # Group documentation links by path component
+    # Group documentation links by their first path component
     for url in doc_links:
-        path = urlparse(url).path.strip("/")
-        if not path:
-            section = "Main"
-        else:
-            section = path.split("/")[0].replace("-", " ").replace("_", " ").title()
-        
-        if section not in sections:
-            sections[section] = []
+        head = _split(url).path.lstrip("/").partition("/")[0]
+        section = head.replace("-", " ").replace("_", " ").title() if head else "Main"
         sections[section].append(url)
     
     # Display sections
@@ -204,24 +254,22 @@ def select_documentation_sections(structure: Dict[str, Any]) -> List[str]:
         
         return selected_urls
 
-def show_progress_spinner(stop_event: threading.Event, message: str):
+def discovery_progress(message: str) -> "tqdm":
     """
-    Display a spinner animation with a message.
+    Create a transient status line for the discovery phase.
+    
+    The exploration is a single blocking call with nothing to report until it
+    returns, so the line shows a static message (tqdm only redraws on update)
+    and is cleared when the context exits.
     
     Args:
-        stop_event: Event to signal when to stop the spinner
-        message: Message to display with the spinner
+        message: Message to display while discovery runs
+        
+    Returns:
+        tqdm instance to use as a context manager
     """
-    symbols = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-    i = 0
-    while not stop_event.is_set():
-        symbol = symbols[i % len(symbols)]
-        click.echo(f"\r{symbol} {message}", nl=False)
-        i += 1
-        time.sleep(0.1)
-    
-    # Clear the line when done
-    click.echo("\r" + " " * (len(message) + 2) + "\r", nl=False)
+    from tqdm import tqdm
+    return tqdm(total=None, desc=message, bar_format="{desc}", leave=False)
 
 #---------------------------------------------------------------------------
 # Command-Line Interface
@@ -232,31 +280,22 @@ def show_progress_spinner(stop_event: threading.Event, message: str):
 @click.pass_context
 def cli(ctx):
     """Interactive documentation scraper with intelligent discovery."""
+    # colorama only has work to do on Windows consoles
+    if sys.platform == "win32":
+        import colorama
+        colorama.init()
+    
     if ctx.invoked_subcommand is None:
         click.clear()
-        click.echo(click.style(r"""
-  ____             _____                                 
- |  _ \  ___   ___|___ / _ __  ___ ___  ___ _ __ ___ 
- | | | |/ _ \ / __| |_ \| '__\/ __/ __|/ __| '__/ _ \
- | |_| | (_) | (__ ___) | |  \__ \__ \ (__| | |  __/
- |____/ \___/ \___|____/|_|  |___/___/\___|_|  \___|
-""", fg="bright_blue"))
-        
-        click.echo(click.style("Documentation Scraper v0.3 - Interactive Mode\n", fg="bright_green"))
+        click.echo(_BANNER)
+        click.echo(_TAGLINE)
         click.echo("This tool helps you download and organize documentation websites with:")
         click.echo(f"• {click.style('Intelligent prioritization', fg='bright_yellow')} of documentation content")
         click.echo(f"• {click.style('Interactive selection', fg='bright_yellow')} of content to download")
         click.echo(f"• {click.style('Structured organization', fg='bright_yellow')} of documentation files")
         
         click.echo("\nTo get started, run one of these commands:")
-        click.echo(click.style("  docscraper download", fg="bright_green") + 
-                   " - Interactive documentation download")
-        click.echo(click.style("  docscraper discover", fg="bright_yellow") + 
-                   " - Preview available documentation sections")
-        click.echo(click.style("  docscraper gui", fg="bright_cyan") + 
-                   " - Launch the graphical user interface")
-        click.echo(click.style("  docscraper --help", fg="bright_white") + 
-                   " - Show all available options")
+        click.echo(_USAGE_LINES)
 
 @cli.command(name="discover")
 @click.option('--url', '-u',
@@ -268,7 +307,8 @@ def cli(ctx):
               type=click.Path(file_okay=True, dir_okay=False),
               default=None)
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed processing information')
-def discover(url, output, verbose):
+@click.pass_context
+def discover(ctx, url, output, verbose):
     """
     Preview available documentation sections with interactive Q&A.
     
@@ -279,22 +319,13 @@ def discover(url, output, verbose):
     setup_logging(verbose)
     click.echo(f"\n🔍 Analyzing documentation structure at {url}")
     
-    # Start a spinner for visual feedback
-    stop_spinner = threading.Event()
-    spinner_thread = threading.Thread(
-        target=show_progress_spinner,
-        args=(stop_spinner, "Analyzing documentation structure...")
-    )
-    spinner_thread.daemon = True
-    spinner_thread.start()
+    # Kept for the follow-up download so it reuses the connections opened here
+    session = create_session()
     
     try:
         # Analyze the documentation structure
-        structure = explore_documentation_structure(url, verbose)
-        
-        # Stop the spinner
-        stop_spinner.set()
-        spinner_thread.join()
+        with discovery_progress("Analyzing documentation structure..."):
+            structure = explore_documentation_structure(url, verbose, session=session)
         
         # Check if analysis was successful
         if structure.get("status") != "success":
@@ -321,31 +352,30 @@ def discover(url, output, verbose):
         
         # Save to file if requested
         if output:
-            import json
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(structure, f, indent=2)
+            try:
+                import orjson
+                data = orjson.dumps(structure, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except ImportError:
+                import json
+                data = json.dumps(structure, indent=2).encode('utf-8')
+            with open(output, 'wb') as f:
+                f.write(data)
             click.echo(click.style(f"\n✓ Analysis saved to {output}", fg="green"))
         
         # Interactive options
         if structure['stats']['doc_links'] > 0:
             if click.confirm("\nWould you like to download this documentation now?"):
-                # Prepare arguments for the download command
-                args = ["docscraper", "download", "--url", url]
-                
-                if verbose:
-                    args.append("--verbose")
-                
-                # Call the download command
-                result = subprocess.run(args)
-                if result.returncode != 0:
+                # Run the download in-process, reusing the analysis we already have
+                try:
+                    ctx.invoke(download, url=url, verbose=verbose,
+                               prefetched_structure=structure, session=session)
+                except click.Abort:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error during download: {e}", exc_info=True)
                     click.echo(click.style("\n❌ Download failed", fg="red"))
         
     except Exception as e:
-        # Stop the spinner
-        stop_spinner.set()
-        if spinner_thread.is_alive():
-            spinner_thread.join()
-        
         logger.error(f"Error during discovery: {e}", exc_info=True)
         click.echo(click.style(f"\n❌ Analysis failed: {e}", fg="red"))
 
@@ -403,34 +433,42 @@ def discover(url, output, verbose):
               default=3, show_default=True, type=int)
 @click.option('--include-content',
               help='Only download pages containing this text pattern (regex)',
-              multiple=True)
+              multiple=True,
+              callback=validate_patterns)
 @click.option('--exclude-content',
               help='Skip pages containing this text pattern (regex)',
-              multiple=True)
+              multiple=True,
+              callback=validate_patterns)
 @click.option('--include-url',
               help='Only download URLs matching this pattern (regex)',
-              multiple=True)
+              multiple=True,
+              callback=validate_patterns)
 @click.option('--exclude-url',
               help='Skip URLs matching this pattern (regex)',
-              multiple=True)
+              multiple=True,
+              callback=validate_patterns)
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed processing information')
 def download(url, output, mode, doc_priority, format, depth, concurrency, delay, 
              max_pages, include_assets, browser_mode, user_agent, proxy, 
              timeout, retries, include_content, exclude_content, 
-             include_url, exclude_url, verbose):
+             include_url, exclude_url, verbose, prefetched_structure=None, session=None):
     """
     Download documentation with intelligent prioritization and organization.
     
     This command provides a sophisticated workflow for downloading documentation
     websites with intelligent content categorization, prioritization of documentation
     content, and interactive selection of sections to download.
+    
+    When invoked from discover, prefetched_structure carries the analysis that
+    was just performed so the site is not explored a second time, and session
+    carries the connection pool it used.
     """
     setup_logging(verbose)
     
     # Resolve output directory
     if not output:
         # Extract domain for naming
-        domain = urlparse(url).netloc
+        domain = _split(url).netloc
         domain_parts = domain.split('.')
         if len(domain_parts) > 1:
             site_name = domain_parts[-2]  # e.g. "example" from "docs.example.com"
@@ -441,7 +479,9 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
         output = os.path.join(".", "docs", f"{site_name}_docs")
     
     # Ensure output directory exists
-    os.makedirs(output, exist_ok=True)
+    if not os.path.isdir(output):
+        os.makedirs(output, exist_ok=True)
+    output_abs = os.path.abspath(output)
     
     # Convert max_pages=0 to None for unlimited
     max_pages_limit = None if max_pages == 0 else max_pages
@@ -451,8 +491,12 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
     if proxy:
         proxies = {"http": proxy, "https": proxy}
     
+    # One pooled session shared by exploration and download keeps connections alive
+    if session is None:
+        session = create_session(concurrency)
+    
     # Display configuration header
-    click.echo(click.style("\n✨ Scraper Configuration:", fg="bright_blue"))
+    click.echo(_HDR_CONFIG)
     click.echo(f"• URL: {click.style(url, fg='bright_green')}")
     click.echo(f"• Output: {click.style(output, fg='bright_green')}")
     click.echo(f"• Mode: {click.style(mode, fg='bright_cyan')}")
@@ -479,7 +523,7 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
         advanced_options.append(f"URL Filters: Yes")
     
     if advanced_options:
-        click.echo(click.style("\nAdvanced Options:", fg="bright_blue"))
+        click.echo(_HDR_ADVANCED)
         for option in advanced_options:
             click.echo(f"• {option}")
     
@@ -487,24 +531,15 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
     start_urls = []
     
     if mode == 'interactive' or mode == 'selective':
-        click.echo(click.style("\n🔍 Analyzing documentation structure...", fg="bright_yellow"))
-        
-        # Start a spinner for visual feedback
-        stop_spinner = threading.Event()
-        spinner_thread = threading.Thread(
-            target=show_progress_spinner,
-            args=(stop_spinner, "Discovering documentation structure...")
-        )
-        spinner_thread.daemon = True
-        spinner_thread.start()
-        
         try:
-            # Analyze the documentation structure
-            structure = explore_documentation_structure(url, verbose)
-            
-            # Stop the spinner
-            stop_spinner.set()
-            spinner_thread.join()
+            if prefetched_structure is not None:
+                structure = prefetched_structure
+            else:
+                click.echo(_MSG_ANALYZING)
+                
+                # Analyze the documentation structure
+                with discovery_progress("Discovering documentation structure..."):
+                    structure = explore_documentation_structure(url, verbose, session=session)
             
             if structure.get("status") != "success":
                 click.echo(click.style(f"\n❌ {structure.get('message', 'Analysis failed')}", fg="red"))
@@ -517,21 +552,24 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
             click.echo(click.style(f"\n📋 Found {doc_count} documentation pages and {aux_count} auxiliary pages", 
                                   fg="bright_green"))
             
+            # Only doc and aux links are used from here on; let the rest be collected
+            links = structure.get("links", {})
+            links.pop("external", None)
+            links.pop("asset", None)
+            doc_links = links.get("doc", [])
+            aux_links = links.get("aux", [])
+            
             if mode == 'selective':
                 # Select specific sections
-                selected_urls = select_documentation_sections(structure)
+                selected_urls = select_documentation_sections(doc_links, aux_links)
                 if not selected_urls:
-                    click.echo(click.style("\n❌ No sections selected. Aborting.", fg="red"))
+                    click.echo(_MSG_NO_SECTIONS)
                     return
                     
                 start_urls = selected_urls
                 click.echo(click.style(f"\n✓ Selected {len(start_urls)} URLs to download", fg="green"))
             else:
-                # Interactive mode - prompt for auxiliary content
-                doc_links = structure.get("links", {}).get("doc", [])
-                aux_links = structure.get("links", {}).get("aux", [])
-                
-                # Always include documentation links
+                # Interactive mode - documentation links are always included
                 start_urls = doc_links
                 
                 # Ask if user wants auxiliary content
@@ -541,16 +579,11 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
                     default=False
                 ):
                     start_urls.extend(aux_links)
-                    click.echo(click.style("✓ Including auxiliary content", fg="green"))
+                    click.echo(_MSG_WITH_AUX)
                 else:
-                    click.echo(click.style("✓ Downloading documentation content only", fg="green"))
+                    click.echo(_MSG_DOCS_ONLY)
                 
         except Exception as e:
-            # Stop the spinner if it's running
-            stop_spinner.set()
-            if spinner_thread.is_alive():
-                spinner_thread.join()
-            
             logger.error(f"Error during discovery: {e}", exc_info=True)
             click.echo(click.style(f"\n❌ Discovery failed: {e}", fg="red"))
             
@@ -560,6 +593,9 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
                 click.echo("Download aborted.")
                 return
     
+    # Selected sections can overlap, so fetch each start URL only once
+    start_urls = list(dict.fromkeys(start_urls))
+    
     # Initialize the scraper
     interactive_mode = mode == 'interactive'
     
@@ -568,9 +604,10 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
         click.echo("Download aborted.")
         return
     
-    click.echo(click.style("\n📥 Starting documentation download...", fg="bright_blue"))
+    click.echo(_MSG_STARTING)
     
     # Create a scraper instance
+    _, DocumentationScraper = _lazy_scraper()
     scraper = DocumentationScraper(
         base_url=url,
         output_dir=output,
@@ -585,14 +622,17 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
         proxies=proxies,
         timeout=timeout,
         retries=retries,
-        content_include_patterns=list(include_content) if include_content else None,
-        content_exclude_patterns=list(exclude_content) if exclude_content else None,
-        url_include_patterns=list(include_url) if include_url else None,
-        url_exclude_patterns=list(exclude_url) if exclude_url else None,
-        verbose=verbose
+        # Filters arrive precompiled from the option callbacks
+        content_include_patterns=list(include_content),
+        content_exclude_patterns=list(exclude_content),
+        url_include_patterns=list(include_url),
+        url_exclude_patterns=list(exclude_url),
+        verbose=verbose,
+        session=session
     )
     
     # Define a progress callback
+    from tqdm import tqdm
     progress_bar = None
     current_url = None
     
@@ -605,13 +645,15 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
                 total=total or 100,
                 desc="Downloading documentation",
                 unit="page",
-                dynamic_ncols=True
+                dynamic_ncols=True,
+                mininterval=0.2,
+                maxinterval=2.0
             )
         
-        # Update the progress bar
+        # Update the progress bar; tqdm throttles the redraws itself
         if total and current <= total:
             progress_bar.total = total
-            progress_bar.n = current
+            progress_bar.update(current - progress_bar.n)
         else:
             # Increment by 1 if total is unknown
             progress_bar.update(1)
@@ -620,18 +662,16 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
         if url != current_url:
             current_url = url
             short_url = url[-40:] if len(url) > 40 else url
-            progress_bar.set_description(f"Processing {short_url}")
-        
-        progress_bar.refresh()
+            progress_bar.set_description(f"Processing {short_url}", refresh=False)
     
     # Set the callback
-    scraper.crawler.progress_callback = progress_callback
+    scraper.progress_callback = progress_callback
     
     try:
         # Start the download
         if start_urls:
             # Use the selected URLs
-            total_pages, total_assets = scraper.crawler.crawl_selected(start_urls)
+            total_pages, total_assets = scraper.crawl(start_urls=start_urls, interactive=interactive_mode)
         else:
             # Regular crawl from base URL
             total_pages, total_assets = scraper.crawl(interactive=interactive_mode)
@@ -641,49 +681,50 @@ def download(url, output, mode, doc_priority, format, depth, concurrency, delay,
             progress_bar.close()
         
         # Display success message
-        click.echo(click.style("\n✅ Download Completed!", fg="bright_green"))
+        click.echo(_MSG_COMPLETED)
         click.echo(f"• Downloaded {total_pages} pages")
         if include_assets:
             click.echo(f"• Downloaded {total_assets} assets")
-        click.echo(f"• Saved to {os.path.abspath(output)}")
+        click.echo(f"• Saved to {output_abs}")
         
         # Handle any failed downloads
         if scraper.failed_urls:
             click.echo(click.style(f"\n⚠️ Failed to download {len(scraper.failed_urls)} URLs:", fg="yellow"))
             # Show first 5 failures
-            for i, (failed_url, error) in enumerate(list(scraper.failed_urls.items())[:5]):
+            for failed_url, error in islice(scraper.failed_urls.items(), 5):
                 click.echo(f"  • {failed_url}: {error}")
             
-            if len(scraper.failed_urls) > 5:
-                click.echo(f"  • ...and {len(scraper.failed_urls) - 5} more")
+            remaining = len(scraper.failed_urls) - 5
+            if remaining > 0:
+                click.echo(f"  • ...and {remaining} more")
         
         # Ask if user wants to open the directory
         if click.confirm("\nOpen the downloaded documentation folder?", default=True):
             try:
                 # Platform-specific commands to open file explorer
                 if sys.platform == "win32":
-                    os.startfile(output)
+                    os.startfile(output_abs)
                 elif sys.platform == "darwin":
-                    subprocess.run(["open", output], check=True)
+                    subprocess.run(["open", output_abs], check=True)
                 else:
-                    subprocess.run(["xdg-open", output], check=True)
+                    subprocess.run(["xdg-open", output_abs], check=True)
             except Exception as e:
                 logger.warning(f"Could not open directory: {e}")
-                click.echo(f"Manually open: {os.path.abspath(output)}")
+                click.echo(f"Manually open: {output_abs}")
         
     except KeyboardInterrupt:
         # Handle user interruption
         if progress_bar:
             progress_bar.close()
         
-        click.echo(click.style("\n⚠️ Download interrupted by user", fg="yellow"))
+        click.echo(_MSG_INTERRUPTED)
         
         # Ask if user wants to save what's been downloaded so far
         if click.confirm("Save downloaded content so far?", default=True):
             try:
                 # Create index file for downloaded content
                 scraper.create_main_index()
-                click.echo(click.style("✓ Saved downloaded content", fg="green"))
+                click.echo(_MSG_SAVED)
             except Exception as e:
                 logger.error(f"Error saving content: {e}")
                 click.echo(click.style(f"❌ Error saving content: {e}", fg="red"))
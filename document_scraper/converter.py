@@ -6,14 +6,125 @@ with special handling for documentation-specific elements.
 """
 
 import re
+import html
 import html2text
 import logging
-from typing import Optional, List, Dict, Any, Union
+import threading
+from functools import lru_cache
+import soupsieve
+from typing import Optional, List, Dict, Any, Union, Tuple
 from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 logger = logging.getLogger("document_scraper")
 
+# Markdown cleanup patterns, compiled once for every document
+_RE_CODE_FENCE_DUP = re.compile(r"```\n```([a-zA-Z0-9_-]+)", re.ASCII)
+_RE_CODE_FENCE_BLANK = re.compile(r"```([a-zA-Z0-9_-]+)\n\n", re.ASCII)
+_RE_REF_LINK = re.compile(r"\n\s*\[\d+\]:\s*")
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+
+# Tag stripper for the text-only fallback (script/style bodies are dropped too)
+_RE_TAGS = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>|<[^>]+>", re.S | re.I)
+
+def _space_headings(text: str) -> str:
+    """
+    Insert a space between a run of '#' and the non-whitespace character after it.
+    
+    Jumps between '#' characters with str.find, so text without headings is
+    scanned once at C speed and returned unchanged.
+    """
+    find = text.find
+    end = len(text)
+    pieces = []
+    pos = 0
+    i = find("#")
+    while i != -1:
+        j = i + 1
+        while j < end and text[j] == "#":
+            j += 1
+        if j < end and not text[j].isspace():
+            pieces.append(text[pos:j])
+            pieces.append(" ")
+            pos = j
+        i = find("#", j)
+    
+    if not pieces:
+        return text
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+# Common documentation content containers, most specific first
+_MAIN_CONTENT_SELECTORS = (
+    "main", "article", "#content", ".content", 
+    "#main-content", ".main-content", "#docs-content", ".documentation",
+    ".doc-content", ".markdown-body", ".article-content", ".post-content",
+    "[role='main']", "[role='article']", ".page-content", ".site-content",
+    # For Cursor.com documentation specifically
+    ".prose", ".markdown", ".mdx-content", ".docs-container",
+    # Fallback general containers
+    ".container", ".wrapper", "#container", "#wrapper",
+    "body"  # Final fallback
+)
+
+
+def _selector_key(selector: str) -> Tuple[str, str]:
+    """
+    Reduce one of the simple content selectors to an (attribute, value) lookup key.
+    
+    Args:
+        selector: Tag name, #id, .class or [role='...'] selector
+        
+    Returns:
+        Tuple of (kind, value) where kind is 'tag', 'id', 'class' or 'role'
+    """
+    if selector.startswith("#"):
+        return ("id", selector[1:])
+    if selector.startswith("."):
+        return ("class", selector[1:])
+    if selector.startswith("[role="):
+        return ("role", selector[6:-1].strip("'\""))
+    return ("tag", selector)
+
+
+# Lookup keys in priority order, plus the same keys as a set for the tree walk
+_MAIN_CONTENT_KEYS = tuple(_selector_key(selector) for selector in _MAIN_CONTENT_SELECTORS)
+_MAIN_CONTENT_KEY_SET = frozenset(_MAIN_CONTENT_KEYS)
+
+def _has_substantial_text(tag: Tag, threshold: int = 100) -> bool:
+    """
+    Check whether a tag holds more than threshold characters of stripped text.
+    
+    Equivalent to len(tag.get_text(strip=True)) > threshold, but stops as soon
+    as enough text has been seen instead of joining the whole subtree.
+    
+    Args:
+        tag: Element to measure
+        threshold: Number of characters that must be exceeded
+        
+    Returns:
+        True if the tag has more than threshold characters of text
+    """
+    total = 0
+    for text in tag.stripped_strings:
+        total += len(text)
+        if total > threshold:
+            return True
+    return False
+
+
+# Page chrome stripped when no content container is found
+_NOISE_SELECTOR = soupsieve.compile("header, footer, nav, .sidebar, .nav, .menu, .toolbar, .banner")
+
+# Per-thread converter cache for convert_html_to_markdown (html2text is not thread-safe)
+_local = threading.local()
+
 
 class HtmlToMarkdownConverter:
     """
@@ -56,55 +167,85 @@ class HtmlToMarkdownConverter:
         Returns:
             Preprocessed HTML content
         """
+        # Use the Lexbor parser when available; it finds the container without building a bs4 tree
+        if SELECTOLAX_AVAILABLE:
+            try:
+                content = self._extract_main_content_lexbor(html_content)
+                if content is not None:
+                    return content
+            except Exception as e:
+                logger.debug(f"selectolax extraction failed, falling back: {e}")
+        
         # Try parsing with lxml first (faster and more lenient)
         try:
             soup = BeautifulSoup(html_content, 'lxml')
-            if soup.find():
-                return self._extract_main_content(soup)
+            return self._extract_main_content(soup, html_content)
         except Exception as e:
             logger.debug(f"lxml parser failed, falling back: {e}")
         
-        # Fallback to html.parser if lxml fails
+        # Fallback to html.parser only if lxml raised
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
-            if soup.find():
-                return self._extract_main_content(soup)
+            return self._extract_main_content(soup, html_content)
         except Exception as e:
             logger.debug(f"html.parser failed, falling back: {e}")
         
         # Last resort: return original content
         return html_content
         
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _extract_main_content_lexbor(self, html_content: str) -> Optional[str]:
+        """
+        Extract the main content container using selectolax's Lexbor parser.
+        
+        Args:
+            html_content: Raw HTML content
+            
+        Returns:
+            HTML of the first substantial container, or None to fall back to BeautifulSoup
+        """
+        tree = LexborHTMLParser(html_content)
+        for selector in _MAIN_CONTENT_SELECTORS:
+            node = tree.css_first(selector)
+            if node is not None and len(node.text(deep=True, separator="", strip=True)) > 100:
+                return node.html
+        return None
+        
+    def _extract_main_content(self, soup: BeautifulSoup, html_content: str) -> str:
         """Enhanced helper to extract main content from parsed HTML with special cases."""
-        # Look for common documentation content containers
-        # Try many common selectors used by popular doc sites
-        selectors = [
-            "main", "article", "#content", ".content", 
-            "#main-content", ".main-content", "#docs-content", ".documentation",
-            ".doc-content", ".markdown-body", ".article-content", ".post-content",
-            "[role='main']", "[role='article']", ".page-content", ".site-content",
-            # For Cursor.com documentation specifically
-            ".prose", ".markdown", ".mdx-content", ".docs-container",
-            # Fallback general containers
-            ".container", ".wrapper", "#container", "#wrapper",
-            "body"  # Final fallback
-        ]
-        
-        for selector in selectors:
-            try:
-                content = soup.select_one(selector)
-                if content and len(content.get_text(strip=True)) > 100:  # Must have substantial text
-                    # Create clean document structure
-                    new_doc = BeautifulSoup(features="html.parser")
-                    new_doc.append(content)
-                    return str(new_doc)
-            except Exception:
+        elements = soup.find_all(True)
+        if not elements:
+            # Nothing parsed into elements; keep the original markup
+            return html_content
+        
+        # Walk the tree once, remembering the first element matching each container
+        # selector, rather than running a separate search per selector
+        first_matches = {}
+        for element in elements:
+            key = ("tag", element.name)
+            if key in _MAIN_CONTENT_KEY_SET and key not in first_matches:
+                first_matches[key] = element
+            attrs = element.attrs
+            if not attrs:
                 continue
-            
+            keys = [("class", name) for name in attrs.get("class") or ()]
+            if "id" in attrs:
+                keys.append(("id", attrs["id"]))
+            if "role" in attrs:
+                keys.append(("role", attrs["role"]))
+            for key in keys:
+                if key in _MAIN_CONTENT_KEY_SET and key not in first_matches:
+                    first_matches[key] = element
+        
+        # Look for common documentation content containers in priority order
+        for key in _MAIN_CONTENT_KEYS:
+            content = first_matches.get(key)
+            if content is not None and _has_substantial_text(content):
+                # Serialize the container directly; wrapping it in a new document adds nothing
+                return content.decode()
+        
         # If we couldn't find a container, try to remove obvious non-content areas
         # like headers, footers, navigation before returning
-        for noise in soup.select('header, footer, nav, .sidebar, .nav, .menu, .toolbar, .banner'):
+        for noise in _NOISE_SELECTOR.select(soup):
             noise.decompose()
         
         return str(soup)
@@ -121,32 +262,26 @@ class HtmlToMarkdownConverter:
         """
         try:
             # Fix code blocks that might have been incorrectly formatted
-            markdown_content = re.sub(r"```\n```([a-zA-Z0-9_-]+)", r"```\1", markdown_content)
+            markdown_content = _RE_CODE_FENCE_DUP.sub(r"```\1", markdown_content)
             
             # Fix unnecessary newlines in code blocks
-            markdown_content = re.sub(r"```([a-zA-Z0-9_-]+)\n\n", r"```\1\n", markdown_content)
+            markdown_content = _RE_CODE_FENCE_BLANK.sub(r"```\1\n", markdown_content)
             
             # Ensure consistent heading styles (ATX-style with space after #)
-            for i in range(6, 0, -1):
-                hashes = "#" * i
-                markdown_content = re.sub(f"{hashes}([^#\n])", f"{hashes} \\1", markdown_content)
+            markdown_content = _space_headings(markdown_content)
             
             # Fix reference-style links
-            markdown_content = re.sub(r"\n\s*\[\d+\]:\s*", "\n", markdown_content)
+            markdown_content = _RE_REF_LINK.sub("\n", markdown_content)
             
             # Fix excess newlines
-            markdown_content = re.sub(r"\n{3,}", "\n\n", markdown_content)
+            markdown_content = _RE_MULTI_NL.sub("\n\n", markdown_content)
             
             # Ensure the document starts with a heading if it doesn't already
-            if not markdown_content.startswith("#"):
-                lines = markdown_content.split("\n")
-                for i, line in enumerate(lines):
-                    if line.strip() and not line.startswith("#"):
-                        lines[i] = f"# {line}"
-                        break
-                markdown_content = "\n".join(lines)
-        
-            return markdown_content.strip()
+            markdown_content = markdown_content.strip()
+            if markdown_content and not markdown_content.startswith("#"):
+                markdown_content = "# " + markdown_content
+        
+            return markdown_content
         except Exception as e:
             logger.error(f"Error postprocessing Markdown: {e}")
             return markdown_content.strip()  # Return stripped original content on error
@@ -162,32 +297,22 @@ class HtmlToMarkdownConverter:
         Returns:
             Converted Markdown content (or fallback text if conversion fails)
         """
+        # Nothing to convert when the input has no markup at all
+        if not html_content or "<" not in html_content:
+            return html_content
+        
+        # preprocess_html falls back to the original HTML itself, so only html2text needs guarding
+        processed_html = self.preprocess_html(html_content)
         try:
-            # First try full conversion pipeline
-            processed_html = self.preprocess_html(html_content)
             markdown_content = self.html2text_instance.handle(processed_html)
-            return self.postprocess_markdown(markdown_content)
-            
         except Exception as e:
             logger.warning(f"Error in HTML conversion pipeline: {e}")
-            
-            # Fallback 1: Try direct conversion without preprocessing
-            try:
-                basic_md = self.html2text_instance.handle(html_content)
-                return basic_md
-            except Exception as e:
-                logger.warning(f"Basic conversion failed: {e}")
-                
-                # Fallback 2: Extract text content only
-                try:
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    return soup.get_text()
-                except Exception as e:
-                    logger.error(f"Complete conversion failure: {e}")
-                    return "[Error converting content]"
+            # Fallback: extract text content only
+            return html.unescape(_RE_TAGS.sub("", html_content))
         
-        # Ensure we always return a string
-        return ""
+        # Release the preprocessed HTML before postprocessing makes its own copies
+        del processed_html
+        return self.postprocess_markdown(markdown_content)
 
 
 def convert_html_to_markdown(html_content: str, base_url: Optional[str] = None) -> str:
@@ -201,5 +326,17 @@ def convert_html_to_markdown(html_content: str, base_url: Optional[str] = None)
     Returns:
         Converted Markdown content
     """
-    converter = HtmlToMarkdownConverter(base_url=base_url)
-    return converter.convert(html_content)
+    return _get_converter(base_url).convert(html_content)
+
+
+def _get_converter(base_url: Optional[str]) -> HtmlToMarkdownConverter:
+    """
+    Get this thread's converter for base_url, creating it on first use.
+    
+    Each thread keeps its own LRU cache so html2text instances are never shared.
+    """
+    get_converter = getattr(_local, "get_converter", None)
+    if get_converter is None:
+        get_converter = lru_cache(maxsize=32)(HtmlToMarkdownConverter)
+        _local.get_converter = get_converter
+    return get_converter(base_url)
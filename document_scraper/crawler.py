@@ -7,14 +7,21 @@ with intelligent link prioritization and categorization.
 
 import os
 import time
+import random
+import atexit
 import logging
 import re
 import requests
+import heapq
+import itertools
+import threading
 import traceback
+import weakref
 from tqdm import tqdm
 import concurrent.futures
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from collections import deque
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin, parse_qs, urlencode
 from typing import List, Dict, Tuple, Set, Optional, Callable, Any, Union
 
@@ -31,9 +38,15 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 from document_scraper.utils import (
     is_asset_url, clean_url, normalize_url, get_domain, is_valid_url,
-    rate_limit, extract_path_segments
+    rate_limit, extract_path_segments, create_session, compile_patterns, combine_patterns
 )
 
 logger = logging.getLogger("document_scraper")
@@ -53,12 +66,215 @@ AUX_PATTERNS = [
     '/legal/', '/terms/', '/privacy/', '/blog/', '/news/'
 ]
 
+# Single-pass matchers for the pattern lists above, applied to lowercased paths
+_DOC_RE = re.compile('|'.join(re.escape(pattern) for pattern in DOC_PATTERNS))
+_AUX_RE = re.compile('|'.join(re.escape(pattern) for pattern in AUX_PATTERNS))
+_EXT_RE = re.compile(r'\.(html|htm|md|pdf|txt)$')
+
+# Parsed-URL cache shared by categorize_url and extract_links
+_parse = lru_cache(maxsize=8192)(urlparse)
+
+# Pattern syntax whose meaning depends on the surrounding text (anchors, word
+# boundaries, lookarounds); such patterns can't be checked chunk by chunk
+_RE_CONTEXT_SENSITIVE = re.compile(r"[\^$]|\\[bBAZ]|\(\?<?[=!]")
+
+# Subdomains of the base site that are treated as documentation
+_DOC_SUBDOMAINS = frozenset([
+    'docs', 'documentation', 'developer', 'api', 'guide', 'help', 'support', 'manual', 'learn'
+])
+
+# Link candidates for extract_links
+_LINK_SELECTORS = [
+    'a[href]',                   # Standard links
+    '[role="link"]',             # Accessibility links
+    '.nav-link',                 # Bootstrap navigation
+    '.sidebar a',                # Sidebar navigation links
+    '.menu a',                   # Menu links
+    '.toc a',                    # Table of contents links
+    'nav a',                     # Navigation links
+    '.navigation a',             # Another navigation pattern
+    '.doc-nav a',                # Documentation navigation
+    '.mdx-content a',            # MDX content links
+    '.md-content a',             # Markdown content links
+    '.prose a',                  # Common prose/content links
+    '[data-testid*="link"]',     # React Testing Library patterns
+    '[data-testid*="nav"]',      # React Testing Library navigation
+    '.MuiLink-root',             # Material UI links
+    '.chakra-link',              # Chakra UI links
+    'header a',                  # Header links
+    'footer a',                  # Footer links
+    '.header-link',              # Header links for anchors
+]
+_LINK_SELECTOR = ', '.join(_LINK_SELECTORS)
+
+# Documentation menus, the clickable elements searched for inside them, and the
+# attribute sweep used for SPA frameworks (Next.js, Gatsby, Nuxt)
+_DOC_MENU_SELECTOR = ', '.join([
+    '.sidebar-item', '.menu-item', '.toc-item', '.nav-item',
+    '.sidebar-link', '.doc-link', '[data-type="link"]',
+    '.docusaurus-highlight-code-line', '.theme-doc-sidebar-item',
+    '[data-sidebar-item]', '[data-menu-id]',
+    # Common sidebar navigation elements
+    '.sidebar-nav', '.doc-sidebar', '.docs-sidebar', 
+    '.sidebar-menu', '.navigation-tree',
+    '.docs-navigation', '.section-nav', '.page-toc'
+])
+_MENU_CLICKABLE_SELECTOR = '[class*="link"], [class*="item"], [data-path], [href], [to]'
+_SPA_LINK_ATTRS = ['data-href', 'data-url', 'data-path', 'href', 'to']
+_SPA_LINK_SELECTOR = ', '.join(f'[{attr}]' for attr in _SPA_LINK_ATTRS)
+
+# BeautifulSoup matching for the selectors above without running soupsieve over every clause
+_DOC_MENU_CLASSES = frozenset([
+    'sidebar-item', 'menu-item', 'toc-item', 'nav-item', 'sidebar-link', 'doc-link',
+    'docusaurus-highlight-code-line', 'theme-doc-sidebar-item', 'sidebar-nav', 'doc-sidebar',
+    'docs-sidebar', 'sidebar-menu', 'navigation-tree', 'docs-navigation', 'section-nav', 'page-toc'
+])
+_LINK_CLASSES = frozenset(['nav-link', 'MuiLink-root', 'chakra-link', 'header-link'])
+_NAV_CONTAINER_TAGS = frozenset(['nav', 'header', 'footer'])
+_NAV_CONTAINER_CLASSES = frozenset([
+    'sidebar', 'menu', 'toc', 'navigation', 'doc-nav', 'mdx-content', 'md-content', 'prose'
+])
+
+
+def _is_link_like(attrs: Dict[str, Any]) -> bool:
+    """Check an element's attributes against the non-ancestor link selectors."""
+    if attrs.get('role') == 'link':
+        return True
+    if not _LINK_CLASSES.isdisjoint(attrs.get('class') or ()):
+        return True
+    testid = attrs.get('data-testid')
+    return testid is not None and ('link' in testid or 'nav' in testid)
+
+
+def _is_doc_menu(attrs: Dict[str, Any]) -> bool:
+    """Check an element's attributes against _DOC_MENU_SELECTOR."""
+    return (not _DOC_MENU_CLASSES.isdisjoint(attrs.get('class') or ()) or
+            attrs.get('data-type') == 'link' or
+            'data-sidebar-item' in attrs or 'data-menu-id' in attrs)
+
+
+def _is_menu_clickable(attrs: Dict[str, Any]) -> bool:
+    """Check an element's attributes against _MENU_CLICKABLE_SELECTOR."""
+    if 'data-path' in attrs or 'href' in attrs or 'to' in attrs:
+        return True
+    classes = ' '.join(attrs.get('class') or ())
+    return 'link' in classes or 'item' in classes
+
+
+def _collect_link_candidates(soup: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Gather the attributes of every element extract_links looks at.
+    
+    For BeautifulSoup this is a single walk of the tree that tracks whether
+    each element sits inside a navigation container or a documentation menu,
+    replacing three soup.select() calls over the selector lists above. Each
+    list is in document order, as select() would return it.
+    
+    Args:
+        soup: Parsed HTML content (BeautifulSoup or a selectolax LexborHTMLParser)
+        
+    Returns:
+        Tuple of (link elements matching _LINK_SELECTOR, clickable elements
+        inside documentation menus, elements with any SPA link attribute)
+    """
+    if SELECTOLAX_AVAILABLE and isinstance(soup, LexborHTMLParser):
+        # Lexbor's selector engine is native code; three queries beat a Python-level walk
+        # Nested menus share descendants; each clickable is collected once, as in the walk below
+        clickables, seen = [], set()
+        for menu_item in soup.css(_DOC_MENU_SELECTOR):
+            clickables.extend(_lexbor_attrs(menu_item.css(_MENU_CLICKABLE_SELECTOR), menu_item.mem_id, seen))
+        return _lexbor_attrs(soup.css(_LINK_SELECTOR)), clickables, _lexbor_attrs(soup.css(_SPA_LINK_SELECTOR))
+    
+    link_elements, clickables, spa_elements = [], [], []
+    # Preorder walk of (element, inside a nav container, inside a documentation menu)
+    stack = [(child, False, False) for child in reversed(soup.contents) if isinstance(child, Tag)]
+    while stack:
+        element, in_nav, in_menu = stack.pop()
+        attrs = element.attrs
+        if element.name == 'a':
+            if 'href' in attrs or in_nav or (attrs and _is_link_like(attrs)):
+                link_elements.append(attrs)
+        elif attrs and _is_link_like(attrs):
+            link_elements.append(attrs)
+        
+        if attrs:
+            if in_menu and _is_menu_clickable(attrs):
+                clickables.append(attrs)
+            if any(attr in attrs for attr in _SPA_LINK_ATTRS):
+                spa_elements.append(attrs)
+            if not in_nav:
+                in_nav = not _NAV_CONTAINER_CLASSES.isdisjoint(attrs.get('class') or ())
+            if not in_menu:
+                in_menu = _is_doc_menu(attrs)
+        in_nav = in_nav or element.name in _NAV_CONTAINER_TAGS
+        
+        children = [(child, in_nav, in_menu) for child in element.contents if isinstance(child, Tag)]
+        children.reverse()
+        stack.extend(children)
+    
+    return link_elements, clickables, spa_elements
+
+
+def _lexbor_attrs(nodes: List[Any], exclude: Optional[int] = None,
+                  seen: Optional[Set[int]] = None) -> List[Dict[str, Optional[str]]]:
+    """
+    Get the attributes of Lexbor nodes, once per node and in document order.
+    
+    Lexbor returns a node once for every clause of a selector list it matches,
+    and Node.css() includes the node it is called on; soupsieve does neither.
+    
+    Args:
+        nodes: Nodes returned by a css() call
+        exclude: mem_id of a node to leave out (the node css() was called on)
+        seen: mem_ids already collected, shared across several css() calls
+        
+    Returns:
+        List of attribute dictionaries
+    """
+    if seen is None:
+        seen = set()
+    attrs = []
+    for node in nodes:
+        mem_id = node.mem_id
+        if mem_id != exclude and mem_id not in seen:
+            seen.add(mem_id)
+            attrs.append(node.attributes)
+    return attrs
+
+
+def _parse_page(html_content: str) -> Any:
+    """
+    Parse a page for link extraction.
+    
+    Args:
+        html_content: Raw HTML content
+        
+    Returns:
+        A LexborHTMLParser tree when selectolax is installed, otherwise BeautifulSoup
+    """
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(html_content)
+    try:
+        # Try lxml parser first (faster)
+        return BeautifulSoup(html_content, 'lxml')
+    except Exception:
+        # Fall back to html.parser
+        return BeautifulSoup(html_content, 'html.parser')
+
+
 class Crawler:
     """
     Advanced web crawler optimized for documentation websites.
     Prioritizes documentation-related links and intelligently categorizes content.
     """
     
+    # ChromeDriver location, resolved at most once per process
+    _chromedriver_path: Optional[str] = None
+    _chromedriver_lock = threading.Lock()
+    
+    # Browser-mode crawlers whose drivers are closed at exit; weak so finished crawlers can be freed
+    _browser_crawlers: "weakref.WeakSet[Crawler]" = weakref.WeakSet()
+    
     def __init__(self, 
                 base_url: str, 
                 max_depth: int = 5,
@@ -77,7 +293,8 @@ class Crawler:
                 content_include_patterns: Optional[List[str]] = None,
                 content_exclude_patterns: Optional[List[str]] = None,
                 stop_event: Optional[Any] = None,
-                progress_callback: Optional[Callable[[str, int, Optional[int]], None]] = None):
+                progress_callback: Optional[Callable[[str, int, Optional[int]], None]] = None,
+                session: Optional[requests.Session] = None):
         """
         Initialize the crawler with configuration options.
         
@@ -100,6 +317,7 @@ class Crawler:
             content_exclude_patterns: Exclude pages with content matching these patterns
             stop_event: Event to signal that crawling should stop
             progress_callback: Callback for reporting progress
+            session: Shared session to reuse pooled connections from (created if None)
         """
         # Base configuration
         self.base_url = base_url.rstrip('/')
@@ -107,6 +325,12 @@ class Crawler:
         self.base_path = urlparse(base_url).path.strip('/')
         self.base_path_segments = self.base_path.split('/') if self.base_path else []
         
+        # Parsed once here since every categorized URL is compared against them
+        self._domain_netloc = urlparse(self.domain).netloc
+        domain_parts = self._domain_netloc.split('.')
+        self._domain_main = '.'.join(domain_parts[-2:]) if len(domain_parts) >= 2 else None
+        self._base_path_prefix = f"/{self.base_path}/"
+        
         # Crawling parameters
         self.max_depth = max_depth
         self.delay = delay
@@ -136,14 +360,34 @@ class Crawler:
         self.content_include_patterns = content_include_patterns or []
         self.content_exclude_patterns = content_exclude_patterns or []
         
-        import re
-        self.url_include_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.url_include_patterns]
-        self.url_exclude_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.url_exclude_patterns]
-        self.content_include_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.content_include_patterns]
-        self.content_exclude_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.content_exclude_patterns]
+        self.url_include_regex = compile_patterns(self.url_include_patterns)
+        self.url_exclude_regex = compile_patterns(self.url_exclude_patterns)
+        self.content_include_regex = compile_patterns(self.content_include_patterns)
+        self.content_exclude_regex = compile_patterns(self.content_exclude_patterns)
+        
+        # Each filter list merged into one alternation, so a check is a single search
+        self._url_include_matcher = combine_patterns(self.url_include_regex)
+        self._url_exclude_matcher = combine_patterns(self.url_exclude_regex)
+        self._content_include_matcher = combine_patterns(self.content_include_regex)
+        self._content_exclude_matcher = combine_patterns(self.content_exclude_regex)
+        # Excluded pages can be rejected while streaming when no pattern depends on context
+        self._stream_exclude = bool(self.content_exclude_regex) and not any(
+            _RE_CONTEXT_SENSITIVE.search(pattern.pattern) for pattern in self.content_exclude_regex
+        )
         
-        # Setup session
-        self.session = requests.Session()
+        # Per-instance memoization of the URL checks; both depend only on the settings above,
+        # and the same link usually turns up on many pages and several times per page
+        self._categorize_cached = lru_cache(maxsize=65536)(self._categorize_url_uncached)
+        self._url_filter_cached = lru_cache(maxsize=65536)(self._matches_url_filters_uncached)
+        
+        # Setup session, reusing the caller's connection pool when one is provided. A session
+        # created here retries 429/5xx responses and read errors in urllib3; a shared one keeps
+        # its owner's policy, so _download_with_retries runs its own retry loop for it instead
+        self._adapter_retries = session is None
+        if session is None:
+            session = create_session(concurrent_requests, status_retries=max(retries - 1, 0),
+                                     read_retries=max(retries - 1, 0))
+        self.session = session
         
         # Default to a modern browser user agent if none provided
         if not user_agent:
@@ -187,6 +431,22 @@ class Crawler:
         # Apply proxies if provided
         if proxies:
             self.session.proxies.update(proxies)
+        
+        # Per-request headers, built once rather than on every download attempt
+        self._request_headers = {
+            'User-Agent': self.session.headers.get('User-Agent', 
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Referer': self.base_url,
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Cache-Control': 'max-age=0',
+            'TE': 'Trailers',
+        }
+        # Exponential backoff base for each retry attempt; jitter is added per wait
+        self._retry_backoffs = [(2 ** attempt) * 0.5 for attempt in range(retries)]
             
         # Setup browser options if using browser mode
         if self.browser_mode:
@@ -195,6 +455,11 @@ class Crawler:
                               "Install selenium and webdriver-manager packages to enable browser mode.")
                 self.browser_mode = False
             self.active_browser_instances = []
+            # One browser per worker thread, reused across pages and closed at exit
+            self._thread_local = threading.local()
+            Crawler._browser_crawlers.add(self)
+        # Whether crawl() is running; it owns (and closes) the per-thread browsers while it is
+        self._in_crawl = False
         
         logger.info(f"Initialized crawler for {base_url}")
         logger.info(f"Base domain: {self.domain}")
@@ -210,6 +475,10 @@ class Crawler:
         Returns:
             Category as string: 'doc', 'aux', 'external', or 'asset'
         """
+        return self._categorize_cached(url)
+    
+    def _categorize_url_uncached(self, url: str) -> str:
+        """Categorize a URL without consulting the cache (see categorize_url)."""
         # Skip if URL is invalid or None
         if not url:
             return 'invalid'
@@ -219,22 +488,19 @@ class Crawler:
             return 'asset'
             
         # Check if it's an external URL
-        parsed_url = urlparse(url)
-        if parsed_url.netloc and parsed_url.netloc != urlparse(self.domain).netloc:
+        parsed_url = _parse(url)
+        if parsed_url.netloc and parsed_url.netloc != self._domain_netloc:
             # Check for related documentation subdomains
-            base_domain_parts = urlparse(self.domain).netloc.split('.')
             url_domain_parts = parsed_url.netloc.split('.')
             
             # Extract main domain (e.g., 'example.com' from 'docs.example.com')
-            if len(base_domain_parts) >= 2 and len(url_domain_parts) >= 2:
-                base_main_domain = '.'.join(base_domain_parts[-2:])
+            if self._domain_main and len(url_domain_parts) >= 2:
                 url_main_domain = '.'.join(url_domain_parts[-2:])
                 
                 # If on same main domain but different subdomain, could be related
-                if base_main_domain == url_main_domain:
+                if self._domain_main == url_main_domain:
                     # Check for documentation-related subdomains
-                    if any(subdomain in ['docs', 'documentation', 'developer', 'api', 'guide', 'help', 'support', 'manual', 'learn'] 
-                           for subdomain in url_domain_parts[:-2]):
+                    if not _DOC_SUBDOMAINS.isdisjoint(url_domain_parts[:-2]):
                         return 'doc'
                 
             return 'external'
@@ -243,12 +509,11 @@ class Crawler:
         path = parsed_url.path.lower()
         
         # First check for documentation patterns
-        for pattern in DOC_PATTERNS:
-            if pattern in path:
-                return 'doc'
+        if _DOC_RE.search(path):
+            return 'doc'
         
         # Check for URL continuation of base path
-        if self.base_path and path.startswith(f"/{self.base_path}/"):
+        if self.base_path and path.startswith(self._base_path_prefix):
             return 'doc'
             
         # Check if the URL shares the initial path segments with the base URL
@@ -259,23 +524,22 @@ class Crawler:
                 return 'doc'
         
         # Check for auxiliary patterns
-        for pattern in AUX_PATTERNS:
-            if pattern in path:
-                return 'aux'
+        if _AUX_RE.search(path):
+            return 'aux'
         
         # Check for common "document-like" URL characteristics
-        if re.search(r'\.(html|htm|md|pdf|txt)$', path):
+        if _EXT_RE.search(path):
             return 'doc'
             
         # Default to auxiliary for anything else on the same domain
         return 'aux'
 
-    def extract_links(self, soup: BeautifulSoup, current_url: str) -> Dict[str, List[str]]:
+    def extract_links(self, soup: Any, current_url: str) -> Dict[str, List[str]]:
         """
         Extract and categorize links from an HTML page.
         
         Args:
-            soup: Parsed HTML content
+            soup: Parsed HTML content (BeautifulSoup or a selectolax LexborHTMLParser)
             current_url: URL of the current page
             
         Returns:
@@ -290,44 +554,22 @@ class Crawler:
         
         seen_urls = set()  # Track already processed URLs
         
-        # Find all link elements with various selectors
-        selectors = [
-            'a[href]',                   # Standard links
-            '[role="link"]',             # Accessibility links
-            '.nav-link',                 # Bootstrap navigation
-            '.sidebar a',                # Sidebar navigation links
-            '.menu a',                   # Menu links
-            '.toc a',                    # Table of contents links
-            'nav a',                     # Navigation links
-            '.navigation a',             # Another navigation pattern
-            '.doc-nav a',                # Documentation navigation
-            '.mdx-content a',            # MDX content links
-            '.md-content a',             # Markdown content links
-            '.prose a',                  # Common prose/content links
-            '[data-testid*="link"]',     # React Testing Library patterns
-            '[data-testid*="nav"]',      # React Testing Library navigation
-            '.MuiLink-root',             # Material UI links
-            '.chakra-link',              # Chakra UI links
-            'header a',                  # Header links
-            'footer a',                  # Footer links
-            '.header-link',              # Header links for anchors
-        ]
-        
-        link_elements = soup.select(', '.join(selectors))
+        # Collect every candidate element in one pass; only their attributes are needed
+        link_elements, clickables, spa_elements = _collect_link_candidates(soup)
         logger.debug(f"Found {len(link_elements)} potential link elements")
         
-        for link in link_elements:
+        for attrs in link_elements:
             href = None
             
             # Extract href from different attribute patterns
-            if link.has_attr('href'):
-                href = link['href']
-            elif link.has_attr('data-href'):
-                href = link['data-href']
-            elif link.has_attr('data-url'):
-                href = link['data-url']
-            elif link.has_attr('to'):  # React Router links
-                href = link['to']
+            if 'href' in attrs:
+                href = attrs['href']
+            elif 'data-href' in attrs:
+                href = attrs['data-href']
+            elif 'data-url' in attrs:
+                href = attrs['data-url']
+            elif 'to' in attrs:  # React Router links
+                href = attrs['to']
             
             if not href:
                 continue
@@ -336,49 +578,29 @@ class Crawler:
             if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
                 continue
             
-            # Normalize the URL
-            try:
-                normalized_url = urljoin(current_url, href)
-                cleaned_url = clean_url(normalized_url)
-                
-                # Skip if already processed
-                if cleaned_url in seen_urls:
-                    continue
-                    
-                seen_urls.add(cleaned_url)
-                
-                # Skip URLs not on the same domain if they're not related subdomains
-                if not cleaned_url.startswith(self.domain):
-                    domain_parts = urlparse(self.domain).netloc.split('.')
-                    url_domain_parts = urlparse(cleaned_url).netloc.split('.')
-                    
-                    # Check if it's a related subdomain
-                    if len(domain_parts) >= 2 and len(url_domain_parts) >= 2:
-                        base_domain = '.'.join(domain_parts[-2:])
-                        url_domain = '.'.join(url_domain_parts[-2:])
-                        
-                        if base_domain != url_domain:
-                            links['external'].append(cleaned_url)
-                            continue
-                    else:
-                        links['external'].append(cleaned_url)
-                        continue
-                
-                # Apply URL filtering
-                if not self._matches_url_filters(cleaned_url):
-                    continue
-                
-                # Categorize the URL
-                category = self.categorize_url(cleaned_url)
-                if category in links:
-                    links[category].append(cleaned_url)
-                    
-            except Exception as e:
-                logger.debug(f"Error processing link '{href}': {e}")
-                continue
+            self._add_link(href, current_url, links, seen_urls, check_domain=True)
         
         # Look for documentation-specific elements that might contain links
-        self._extract_special_doc_links(soup, current_url, links, seen_urls)
+        for attrs in clickables:
+            path = None
+            if 'data-path' in attrs:
+                path = attrs['data-path']
+            elif 'data-target' in attrs:
+                path = attrs['data-target']
+            elif 'href' in attrs:
+                path = attrs['href']
+            elif 'to' in attrs:
+                path = attrs['to']
+                
+            if path and not path.startswith(('#', 'javascript:')):
+                self._add_link(path, current_url, links, seen_urls)
+        
+        # Special case for SPAs like Next.js, Gatsby, Nuxt
+        for attrs in spa_elements:
+            for attr in _SPA_LINK_ATTRS:
+                path = attrs.get(attr)
+                if path and not path.startswith(('#', 'javascript:')):
+                    self._add_link(path, current_url, links, seen_urls)
         
         # Log summary of discovered links
         logger.info(f"Extracted links from {current_url}:")
@@ -387,85 +609,48 @@ class Crawler:
             
         return links
 
-    def _extract_special_doc_links(self, soup: BeautifulSoup, current_url: str, 
-                                   links: Dict[str, List[str]], seen_urls: Set[str]):
+    def _add_link(self, href: str, current_url: str, links: Dict[str, List[str]],
+                  seen_urls: Set[str], check_domain: bool = False) -> None:
         """
-        Extract links from documentation-specific elements.
+        Normalize, filter and categorize one extracted link.
         
         Args:
-            soup: Parsed HTML content
+            href: Link target as found in the page
             current_url: URL of the current page
-            links: Dictionary of already extracted links
+            links: Categorized links collected so far
             seen_urls: Set of already processed URLs
+            check_domain: Record links to unrelated domains as external before filtering
         """
-        # Documentation-specific elements
-        doc_selectors = [
-            '.sidebar-item', '.menu-item', '.toc-item', '.nav-item',
-            '.sidebar-link', '.doc-link', '[data-type="link"]',
-            '.docusaurus-highlight-code-line', '.theme-doc-sidebar-item',
-            '[data-sidebar-item]', '[data-menu-id]',
-            # Common sidebar navigation elements
-            '.sidebar-nav', '.doc-sidebar', '.docs-sidebar', 
-            '.sidebar-menu', '.navigation-tree',
-            '.docs-navigation', '.section-nav', '.page-toc'
-        ]
-        
-        for menu_item in soup.select(', '.join(doc_selectors)):
-            # Find clickable elements
-            for clickable in menu_item.select('[class*="link"], [class*="item"], [data-path], [href], [to]'):
-                path = None
-                if clickable.has_attr('data-path'):
-                    path = clickable['data-path']
-                elif clickable.has_attr('data-target'):
-                    path = clickable['data-target']
-                elif clickable.has_attr('href'):
-                    path = clickable['href']
-                elif clickable.has_attr('to'):
-                    path = clickable['to']
-                    
-                if path and not path.startswith(('#', 'javascript:')):
-                    try:
-                        url = urljoin(current_url, path)
-                        cleaned_url = clean_url(url)
-                        
-                        if cleaned_url not in seen_urls:
-                            seen_urls.add(cleaned_url)
-                            
-                            # Apply URL filtering
-                            if not self._matches_url_filters(cleaned_url):
-                                continue
-                            
-                            # Categorize the URL
-                            category = self.categorize_url(cleaned_url)
-                            if category in links:
-                                links[category].append(cleaned_url)
-                    except Exception as e:
-                        logger.debug(f"Error processing special link '{path}': {e}")
-                        continue
-        
-        # Special case for SPAs like Next.js, Gatsby, Nuxt
-        for element in soup.select('[data-href], [data-url], [data-path], [href], [to]'):
-            for attr in ['data-href', 'data-url', 'data-path', 'href', 'to']:
-                if element.has_attr(attr) and element[attr] and not element[attr].startswith(('#', 'javascript:')):
-                    try:
-                        path = element[attr]
-                        url = urljoin(current_url, path)
-                        cleaned_url = clean_url(url)
-                        
-                        if cleaned_url not in seen_urls:
-                            seen_urls.add(cleaned_url)
-                            
-                            # Apply URL filtering
-                            if not self._matches_url_filters(cleaned_url):
-                                continue
-                            
-                            # Categorize the URL
-                            category = self.categorize_url(cleaned_url)
-                            if category in links:
-                                links[category].append(cleaned_url)
-                    except Exception as e:
-                        logger.debug(f"Error processing data attribute link '{path}': {e}")
-                        continue
+        try:
+            cleaned_url = clean_url(urljoin(current_url, href))
+            
+            # Skip if already processed
+            if cleaned_url in seen_urls:
+                return
+                
+            seen_urls.add(cleaned_url)
+            
+            # Skip URLs not on the same domain if they're not related subdomains
+            if check_domain and not cleaned_url.startswith(self.domain):
+                url_domain_parts = _parse(cleaned_url).netloc.split('.')
+                
+                # Check if it's a related subdomain
+                if not (self._domain_main and len(url_domain_parts) >= 2 and
+                        self._domain_main == '.'.join(url_domain_parts[-2:])):
+                    links['external'].append(cleaned_url)
+                    return
+            
+            # Apply URL filtering
+            if not self._matches_url_filters(cleaned_url):
+                return
+            
+            # Categorize the URL
+            category = self.categorize_url(cleaned_url)
+            if category in links:
+                links[category].append(cleaned_url)
+                
+        except Exception as e:
+            logger.debug(f"Error processing link '{href}': {e}")
 
     def _matches_url_filters(self, url: str) -> bool:
         """
@@ -477,13 +662,17 @@ class Crawler:
         Returns:
             True if URL should be included, False if it should be excluded
         """
+        return self._url_filter_cached(url)
+    
+    def _matches_url_filters_uncached(self, url: str) -> bool:
+        """Apply the URL filters without consulting the cache (see _matches_url_filters)."""
         # If include patterns are specified, URL must match at least one
-        if self.url_include_regex and not any(pattern.search(url) for pattern in self.url_include_regex):
+        if self._url_include_matcher and not self._url_include_matcher.search(url):
             logger.debug(f"URL excluded (no include match): {url}")
             return False
             
         # If URL matches any exclude pattern, it's excluded
-        if any(pattern.search(url) for pattern in self.url_exclude_regex):
+        if self._url_exclude_matcher and self._url_exclude_matcher.search(url):
             logger.debug(f"URL excluded (exclude match): {url}")
             return False
             
@@ -500,24 +689,25 @@ class Crawler:
             True if content should be included, False if it should be excluded
         """
         # If include patterns exist, content must match at least one
-        if self.content_include_regex:
-            if not any(pattern.search(html_content) for pattern in self.content_include_regex):
+        if self._content_include_matcher:
+            if not self._content_include_matcher.search(html_content):
                 logger.debug("Content excluded (no include match)")
                 return False
                 
         # If content matches any exclude pattern, it's excluded
-        if any(pattern.search(html_content) for pattern in self.content_exclude_regex):
+        if self._content_exclude_matcher and self._content_exclude_matcher.search(html_content):
             logger.debug("Content excluded (exclude match)")
             return False
             
         return True
         
-    def _download_with_retries(self, url: str) -> requests.Response:
+    def _download_with_retries(self, url: str, stream: bool = False) -> requests.Response:
         """
         Download a URL with retry logic, exponential backoff, and better error handling.
         
         Args:
             url: The URL to download
+            stream: Leave the body unread so the caller can consume it incrementally
             
         Returns:
             Response object
@@ -525,44 +715,53 @@ class Crawler:
         Raises:
             requests.exceptions.RequestException: On failure after retries
         """
+        if self._adapter_retries:
+            # The session's adapter already retries connection and read errors and 429/5xx with
+            # backoff. It stops at the response headers, so a body cut off mid-transfer is retried here
+            for attempt in range(self.retries):
+                try:
+                    response = self.session.get(
+                        url,
+                        headers=self._request_headers,
+                        timeout=self.timeout,
+                        allow_redirects=True,
+                        stream=stream
+                    )
+                except requests.exceptions.ChunkedEncodingError as e:
+                    if attempt == self.retries - 1:
+                        logger.error(f"Failed to download {url} after {self.retries} attempts: {e}")
+                        raise
+                    wait_time = min(self._retry_backoffs[attempt + 1] + random.uniform(0.1, 0.5), 10)
+                    logger.debug(f"Retry {attempt + 2}/{self.retries} for {url} in {wait_time:.2f}s")
+                    time.sleep(wait_time)
+                    continue
+                self._raise_for_status(response)
+                return response
+        
         for attempt in range(self.retries):
             try:
-                # Customize headers for each request to look more like a browser
-                custom_headers = {
-                    'User-Agent': self.session.headers.get('User-Agent', 
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'),
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Referer': self.base_url,
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Cache-Control': 'max-age=0',
-                    'TE': 'Trailers',
-                }
-                
                 # Add a slightly randomized delay to appear more human-like
-                import random
                 if attempt > 0:
-                    jitter = random.uniform(0.1, 0.5)
-                    wait_time = min((2 ** attempt) * 0.5 + jitter, 10)
+                    wait_time = min(self._retry_backoffs[attempt] + random.uniform(0.1, 0.5), 10)
                     logger.debug(f"Retry {attempt + 1}/{self.retries} for {url} in {wait_time:.2f}s")
                     time.sleep(wait_time)
                 
                 response = self.session.get(
                     url,
-                    headers=custom_headers,
+                    headers=self._request_headers,
                     timeout=self.timeout,
-                    allow_redirects=True
+                    allow_redirects=True,
+                    stream=stream
                 )
                 
                 # Handle common status codes
                 if response.status_code == 429:  # Too Many Requests
                     logger.warning(f"Rate limited on {url}, retrying after longer delay")
+                    response.close()
                     time.sleep(min(30, 5 * (attempt + 1)))  # Longer delay for rate limiting
                     continue
                     
-                response.raise_for_status()
+                self._raise_for_status(response)
                 return response
                 
             except requests.exceptions.RequestException as e:
@@ -573,6 +772,42 @@ class Crawler:
         # This should never be reached due to the raise in the exception handler
         raise requests.exceptions.RequestException(f"Failed to download {url} after {self.retries} attempts")
 
+    @staticmethod
+    def _raise_for_status(response: requests.Response) -> None:
+        """Raise for an HTTP error status, releasing an unread (streamed) body first."""
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+    
+    def _read_unless_excluded(self, response: requests.Response) -> Optional[str]:
+        """
+        Read a streamed response body, stopping as soon as a chunk matches a content exclude pattern.
+        
+        A match spanning two chunks is not seen here; _matches_content_filters
+        still checks the full text of every page that is kept.
+        
+        Args:
+            response: Response requested with stream=True
+            
+        Returns:
+            The decoded body, or None if the page is excluded
+        """
+        with response:
+            if response.encoding is None:
+                # No charset to decode with incrementally; let requests detect it from the full body
+                return response.text
+            
+            search = self._content_exclude_matcher.search
+            chunks = []
+            for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                if search(chunk):
+                    logger.debug("Content excluded (exclude match while streaming)")
+                    return None
+                chunks.append(chunk)
+            return ''.join(chunks)
+    
     def download_url(self, url: str) -> Tuple[Optional[str], Optional[Dict[str, List[str]]]]:
         """
         Download a URL and extract links from it.
@@ -591,15 +826,25 @@ class Crawler:
             
             # Use Selenium for browser mode to handle JavaScript-rendered pages
             if self.browser_mode and SELENIUM_AVAILABLE:
-                html_content, links = self._download_with_browser(url)
+                try:
+                    html_content, links = self._download_with_browser(url)
+                finally:
+                    # Outside crawl() nothing else will close this thread's browser
+                    if not self._in_crawl:
+                        self._release_thread_driver()
                 if html_content is not None:
                     return html_content, links
                 else:
                     logger.warning(f"Browser mode failed for {url}, falling back to regular request")
             
-            # Regular HTTP request
-            response = self._download_with_retries(url)
-            html_content = response.text
+            # Regular HTTP request; with exclude patterns, stream so excluded pages are dropped early
+            if self._stream_exclude:
+                html_content = self._read_unless_excluded(self._download_with_retries(url, stream=True))
+                if html_content is None:
+                    return None, None
+            else:
+                response = self._download_with_retries(url)
+                html_content = response.text
             
             # Check for stop event after HTTP request
             if self.stop_event and self.stop_event.is_set():
@@ -610,17 +855,12 @@ class Crawler:
             if not self._matches_content_filters(html_content):
                 return None, None
             
-            # Parse HTML - try multiple parsers for better compatibility
+            # Parse HTML - selectolax when installed, otherwise BeautifulSoup with parser fallbacks
             try:
-                # Try lxml parser first (faster)
-                soup = BeautifulSoup(html_content, 'lxml')
-            except Exception:
-                try:
-                    # Fall back to html.parser
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                except Exception as e:
-                    logger.error(f"Error parsing HTML: {e}")
-                    return html_content, None
+                soup = _parse_page(html_content)
+            except Exception as e:
+                logger.error(f"Error parsing HTML: {e}")
+                return html_content, None
             
             # Final stop check before completing
             if self.stop_event and self.stop_event.is_set():
@@ -660,37 +900,12 @@ class Crawler:
         """
         driver = None
         try:
-            # Configure headless Chrome browser with improved options
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--ignore-certificate-errors")
-            chrome_options.add_argument("--ignore-ssl-errors")
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument(f"user-agent={self.session.headers.get('User-Agent')}")
-            chrome_options.add_argument("--page-load-strategy=eager")  # Don't wait for all resources
-            
-            logger.debug(f"Browser mode: initializing Chrome driver for {url}")
-            
-            # Create a new browser instance for each page to avoid memory issues
-            driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            # Add to active browsers list for cleanup
-            self.active_browser_instances.append(driver)
-            
-            # Set page load timeout - shorter timeout for faster response to stop events
-            driver.set_page_load_timeout(min(10, self.timeout))
+            # Reuse this worker thread's browser; starting Chrome takes seconds per page
+            driver = self._get_thread_driver()
             
             # Check for stop event before loading page
             if self.stop_event and self.stop_event.is_set():
                 logger.info(f"Stopping before loading {url}")
-                driver.quit()
-                if driver in self.active_browser_instances:
-                    self.active_browser_instances.remove(driver)
                 return None, None
                 
             # Load the page
@@ -700,9 +915,6 @@ class Crawler:
             # Check for stop event immediately after page load
             if self.stop_event and self.stop_event.is_set():
                 logger.info(f"Stopping after initial page load of {url}")
-                driver.quit()
-                if driver in self.active_browser_instances:
-                    self.active_browser_instances.remove(driver)
                 return None, None
             
             # Wait for dynamic content to load
@@ -722,9 +934,6 @@ class Crawler:
             # Check for stop event again before processing content
             if self.stop_event and self.stop_event.is_set():
                 logger.info(f"Stopping during page load of {url}")
-                driver.quit()
-                if driver in self.active_browser_instances:
-                    self.active_browser_instances.remove(driver)
                 return None, None
             
             # Get the page source after JavaScript execution
@@ -737,10 +946,7 @@ class Crawler:
             # Parse the HTML with fallback parsers
             logger.debug(f"Browser mode: parsing HTML content")
             try:
-                soup = BeautifulSoup(html_content, 'lxml')
-            except ImportError:
-                logger.warning("lxml parser not available, falling back to html.parser")
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = _parse_page(html_content)
             except Exception as e:
                 logger.error(f"Error parsing HTML with any parser: {e}")
                 return None, None
@@ -748,9 +954,6 @@ class Crawler:
             # Final stop check before link extraction
             if self.stop_event and self.stop_event.is_set():
                 logger.info(f"Stopping before link extraction for {url}")
-                driver.quit()
-                if driver in self.active_browser_instances:
-                    self.active_browser_instances.remove(driver)
                 return None, None
             
             # Extract links
@@ -761,6 +964,9 @@ class Crawler:
             
         except (TimeoutException, WebDriverException) as e:
             logger.warning(f"Browser automation error for {url}: {e}")
+            # The browser may be wedged; make the next page on this thread start a fresh one
+            if driver:
+                self._discard_driver(driver)
             return None, None
         except Exception as e:
             logger.error(f"Unexpected error in browser mode for {url}: {e}")
@@ -770,16 +976,68 @@ class Crawler:
             elif "chromedriver" in str(e).lower() or "webdriver" in str(e).lower():
                 logger.error("ChromeDriver is required. Install with: pip install webdriver-manager")
             return None, None
-        finally:
-            # Always close the browser
-            if driver:
-                try:
-                    driver.quit()
-                    if driver in self.active_browser_instances:
-                        self.active_browser_instances.remove(driver)
-                    logger.debug(f"Browser mode: browser closed for {url}")
-                except Exception as e:
-                    logger.warning(f"Error closing browser: {e}")
+    
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        """Install (or locate) ChromeDriver once per process and return its path."""
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path is None:
+                cls._chromedriver_path = ChromeDriverManager().install()
+            return cls._chromedriver_path
+    
+    def _get_thread_driver(self) -> Any:
+        """
+        Get the headless Chrome driver owned by the current thread, starting it on first use.
+        
+        Returns:
+            Selenium WebDriver instance
+        """
+        driver = getattr(self._thread_local, 'driver', None)
+        # A driver closed by _cleanup_browser_instances is no longer in the active list
+        if driver is not None and driver in self.active_browser_instances:
+            return driver
+        
+        # Configure headless Chrome browser with improved options
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--ignore-certificate-errors")
+        chrome_options.add_argument("--ignore-ssl-errors")
+        chrome_options.add_argument("--incognito")
+        chrome_options.add_argument(f"user-agent={self.session.headers.get('User-Agent')}")
+        chrome_options.add_argument("--page-load-strategy=eager")  # Don't wait for all resources
+        
+        logger.debug("Browser mode: initializing Chrome driver")
+        driver = webdriver.Chrome(
+            service=Service(self._get_chromedriver_path()),
+            options=chrome_options
+        )
+        # Set page load timeout - shorter timeout for faster response to stop events
+        driver.set_page_load_timeout(min(10, self.timeout))
+        
+        # Add to active browsers list for cleanup
+        self.active_browser_instances.append(driver)
+        self._thread_local.driver = driver
+        return driver
+    
+    def _release_thread_driver(self) -> None:
+        """Close the current thread's browser, if it has one."""
+        driver = getattr(self._thread_local, 'driver', None)
+        if driver is not None:
+            self._discard_driver(driver)
+    
+    def _discard_driver(self, driver: Any) -> None:
+        """Close a driver and forget it so its thread starts a new one."""
+        if getattr(self._thread_local, 'driver', None) is driver:
+            self._thread_local.driver = None
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+        if driver in self.active_browser_instances:
+            self.active_browser_instances.remove(driver)
 
     def crawl(self, callback: Optional[Callable[[str, str, Dict[str, List[str]]], None]] = None, 
               interactive: bool = False) -> Tuple[int, Dict[str, Set[str]]]:
@@ -796,6 +1054,9 @@ class Crawler:
         logger.info(f"Starting crawl from {self.base_url}")
         logger.info(f"Max depth: {self.max_depth}, Max pages: {self.max_pages or 'unlimited'}")
         
+        # Browsers stay open across pages until the cleanup at the end of the crawl
+        self._in_crawl = True
+        
         # Reset counters
         self.pages_downloaded = 0
         self.visited.clear()
@@ -807,7 +1068,10 @@ class Crawler:
         self.asset_links.clear()
         
         # Initialize queues for priority crawling
-        doc_queue = deque([(self.base_url, 0)])  # (url, depth)
+        # Priority frontier of (priority, depth, sequence, url); when max_pages cuts the crawl
+        # short, pages on the documentation host and shallower pages are fetched first
+        sequence = itertools.count()
+        frontier = [(0, 0, next(sequence), self.base_url)]
         self.queued.add(self.base_url)
         
         # Setup progress tracking
@@ -820,38 +1084,31 @@ class Crawler:
         
         # First phase: Process documentation pages
         logger.info("Phase 1: Crawling documentation pages...")
-        while doc_queue and (self.max_pages is None or self.pages_downloaded < self.max_pages) and not stopping:
-            # Check for stop event
-            if self.stop_event and self.stop_event.is_set():
-                logger.warning("Stop event detected, halting crawl...")
-                stopping = True
-                break
+        
+        # Keep up to concurrent_requests downloads in flight on one pool for the whole crawl,
+        # refilling as each finishes instead of waiting for the slowest page of a batch
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrent_requests) as executor:
+            in_flight = {}
+            while frontier or in_flight:
+                # Check for stop event
+                if self.stop_event and self.stop_event.is_set():
+                    logger.warning("Stop event detected, halting crawl...")
+                    stopping = True
+                    break
+                
+                # Top up the window without submitting more pages than max_pages allows
+                while (frontier and len(in_flight) < self.concurrent_requests and
+                       (self.max_pages is None or self.pages_downloaded + len(in_flight) < self.max_pages)):
+                    _, depth, _, url = heapq.heappop(frontier)
+                    in_flight[executor.submit(self.download_url, url)] = (url, depth)
                 
-            # Process in batches for concurrent crawling
-            batch = []
-            for _ in range(min(self.concurrent_requests, len(doc_queue))):
-                if not doc_queue:
+                if not in_flight:
                     break
-                batch.append(doc_queue.popleft())
-            
-            if not batch:
-                break
                 
-            logger.info(f"Processing batch of {len(batch)} documentation URLs")
-            
-            # Process batch concurrently
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrent_requests) as executor:
-                future_to_url = {
-                    executor.submit(self.download_url, url): (url, depth) 
-                    for url, depth in batch if not stopping
-                }
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
                 
-                for future in concurrent.futures.as_completed(future_to_url):
-                    # Skip processing if stopping
-                    if stopping:
-                        continue
-                        
-                    url, depth = future_to_url[future]
+                for future in done:
+                    url, depth = in_flight.pop(future)
                     
                     try:
                         html_content, links = future.result()
@@ -891,21 +1148,21 @@ class Crawler:
                                     self.asset_links.update(category_links)
                             
                             # Add new documentation links to the queue if not already processed
+                            # (everything ever put on the frontier is in self.queued, so the set alone dedupes)
                             if depth < self.max_depth:
                                 for doc_link in links.get('doc', []):
-                                    if (doc_link not in self.visited and 
-                                        doc_link not in self.queued and 
-                                        not any(item[0] == doc_link for item in doc_queue)):
-                                        doc_queue.append((doc_link, depth + 1))
+                                    if doc_link not in self.visited and doc_link not in self.queued:
+                                        heapq.heappush(frontier, (self._frontier_priority(doc_link), depth + 1,
+                                                                  next(sequence), doc_link))
                                         self.queued.add(doc_link)
                         
                     except Exception as e:
                         logger.error(f"Error processing {url}: {e}")
                         logger.debug(traceback.format_exc())
-                        
-            # Respect the delay between batches
-            if self.delay > 0 and doc_queue and not stopping:
-                time.sleep(self.delay)
+                
+                # Respect the delay, spread so that every concurrent_requests pages wait delay seconds
+                if self.delay > 0 and frontier:
+                    time.sleep(self.delay * len(done) / self.concurrent_requests)
                 
         # Second phase: Process auxiliary pages if requested
         if not stopping and (self.max_pages is None or self.pages_downloaded < self.max_pages):
@@ -951,7 +1208,7 @@ class Crawler:
                     # Similar crawling logic as above for auxiliary pages
                     # ...
                     # Since the logic is essentially the same, we'd just repeat the same processing
-                    # with aux_queue instead of doc_queue
+                    # with aux_queue instead of the documentation frontier
                     # ...
         
         # Close progress bar if open
@@ -959,6 +1216,7 @@ class Crawler:
             pbar.close()
             
         # Cleanup browser instances if any are still active
+        self._in_crawl = False
         self._cleanup_browser_instances()
         
         # Return results
@@ -980,6 +1238,21 @@ class Crawler:
             
         return self.pages_downloaded, categorized_urls
     
+    def _frontier_priority(self, url: str) -> int:
+        """
+        Get the crawl priority of a documentation URL; lower values are fetched first.
+        
+        Only documentation links enter the frontier (auxiliary pages are crawled in a
+        separate phase), so priority only distinguishes the base host from subdomains.
+        
+        Args:
+            url: URL being queued
+            
+        Returns:
+            0 for documentation on the base host, 1 for documentation subdomains
+        """
+        return 0 if _parse(url).netloc == self._domain_netloc else 1
+    
     def _cleanup_browser_instances(self):
         """Clean up any active browser instances to ensure proper shutdown."""
         if hasattr(self, 'active_browser_instances'):
@@ -993,6 +1266,12 @@ class Crawler:
             # Clear the list after cleanup
             self.active_browser_instances.clear()
     
+    @classmethod
+    def _cleanup_all_browsers(cls):
+        """Close the browsers of every crawler still alive at interpreter exit."""
+        for crawler in list(cls._browser_crawlers):
+            crawler._cleanup_browser_instances()
+    
     def get_interactive_response(self, question: str, default: bool = False) -> bool:
         """
         Get an interactive response from the user.
@@ -1006,4 +1285,8 @@ class Crawler:
         """
         # In a real implementation, this would show a prompt or use another mechanism
         # For now, we'll return the default
-        return default
\ No newline at end of file
+        return default
+
+
+# A single exit hook for all crawlers, rather than one bound method (and crawler) per instance
+atexit.register(Crawler._cleanup_all_browsers)
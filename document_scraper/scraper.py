@@ -25,7 +25,8 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from document_scraper.utils import (
     is_asset_url, get_asset_path, rate_limit,
     create_path_from_url, ensure_directory_exists,
-    is_valid_url, get_domain, normalize_url, clean_url,
+    is_valid_url, get_domain, normalize_url, clean_url, create_session,
+    compile_patterns, combine_patterns,
 )
 from document_scraper.formats import get_formatter
 from document_scraper.converter import HtmlToMarkdownConverter
@@ -66,7 +67,8 @@ class DocumentationScraper:
                  progress_callback: Optional[Callable[[str, int, Optional[int]], None]] = None,
                  max_retries: int = 3,
                  stop_event: Optional[Any] = None,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the scraper with configuration options.
         
@@ -86,6 +88,7 @@ class DocumentationScraper:
             progress_callback: Optional callback function for progress updates.
                                Takes (url, current_count, total_count) as arguments.
             stop_event: Optional event to signal the scraper to stop processing.
+            session: Shared session to reuse pooled connections from. Defaults to a new one.
         """
         # Known problematic URLs to skip
         self.skip_urls = {
@@ -148,14 +151,19 @@ class DocumentationScraper:
         self.url_exclude_patterns = url_exclude_patterns or []
         
         # Compile regex patterns for better performance
-        import re
-        self.content_include_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.content_include_patterns]
-        self.content_exclude_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.content_exclude_patterns]
-        self.url_include_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.url_include_patterns]
-        self.url_exclude_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.url_exclude_patterns]
+        self.content_include_regex = compile_patterns(self.content_include_patterns)
+        self.content_exclude_regex = compile_patterns(self.content_exclude_patterns)
+        self.url_include_regex = compile_patterns(self.url_include_patterns)
+        self.url_exclude_regex = compile_patterns(self.url_exclude_patterns)
         
-        # Setup session for persistent connections
-        self.session = requests.Session()
+        # Each filter list merged into one alternation, so a check is a single search
+        self._url_include_matcher = combine_patterns(self.url_include_regex)
+        self._url_exclude_matcher = combine_patterns(self.url_exclude_regex)
+        self._content_include_matcher = combine_patterns(self.content_include_regex)
+        self._content_exclude_matcher = combine_patterns(self.content_exclude_regex)
+        
+        # Setup session for persistent connections, reusing the caller's pool if given
+        self.session = session if session is not None else create_session(concurrent_requests)
         
         # Configure realistic browser-like behavior
         self.browser_mode = browser_mode
@@ -358,12 +366,12 @@ class DocumentationScraper:
             True if URL should be included, False if it should be excluded
         """
         # If include patterns are specified, URL must match at least one
-        if self.url_include_regex and not any(pattern.search(url) for pattern in self.url_include_regex):
+        if self._url_include_matcher and not self._url_include_matcher.search(url):
             logger.debug(f"URL excluded (no include match): {url}")
             return False
             
         # If URL matches any exclude pattern, it's excluded
-        if any(pattern.search(url) for pattern in self.url_exclude_regex):
+        if self._url_exclude_matcher and self._url_exclude_matcher.search(url):
             logger.debug(f"URL excluded (exclude match): {url}")
             return False
             
@@ -1069,13 +1077,13 @@ class DocumentationScraper:
             True if content should be included, False if it should be excluded
         """
         # If include patterns exist, content must match at least one
-        if self.content_include_regex:
-            if not any(pattern.search(html_content) for pattern in self.content_include_regex):
+        if self._content_include_matcher:
+            if not self._content_include_matcher.search(html_content):
                 logger.debug("Content excluded (no include match)")
                 return False
                 
         # If content matches any exclude pattern, it's excluded
-        if any(pattern.search(html_content) for pattern in self.content_exclude_regex):
+        if self._content_exclude_matcher and self._content_exclude_matcher.search(html_content):
             logger.debug("Content excluded (exclude match)")
             return False
             
@@ -1321,7 +1329,9 @@ class DocumentationScraper:
         # Flag to track if we're in stopping state
         stopping = False
         
-        with tqdm(total=self.max_pages, desc="Downloading pages", unit="page", disable=self.max_pages is None) as pbar:
+        # One worker pool serves every batch instead of spinning up new threads per batch
+        with tqdm(total=self.max_pages, desc="Downloading pages", unit="page", disable=self.max_pages is None) as pbar, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrent_requests) as executor:
             logger.info(f"Starting crawl with {len(queue)} URLs in queue")
             
             while queue and (self.max_pages is None or self.pages_downloaded < self.max_pages) and not stopping:
@@ -1350,99 +1360,98 @@ class DocumentationScraper:
                 
                 logger.info(f"Processing batch of {len(batch)} URLs")
                 
-                # Process the batch with concurrent requests
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrent_requests) as executor:
-                    future_to_url = {
-                        executor.submit(self.download_page, url): (url, depth) 
-                        for url, depth in batch if not stopping
-                    }
-                    
-                    # Store active futures for proper cancellation if needed
-                    self.active_futures.extend(future_to_url.keys())
+                # Process the batch on the crawl's shared worker pool
+                future_to_url = {
+                    executor.submit(self.download_page, url): (url, depth) 
+                    for url, depth in batch if not stopping
+                }
+                
+                # Store active futures for proper cancellation if needed
+                self.active_futures.extend(future_to_url.keys())
+                
+                for future in concurrent.futures.as_completed(future_to_url):
+                    # Remove from active futures once completed
+                    if future in self.active_futures:
+                        self.active_futures.remove(future)
                     
-                    for future in concurrent.futures.as_completed(future_to_url):
-                        # Remove from active futures once completed
-                        if future in self.active_futures:
-                            self.active_futures.remove(future)
+                    # Check for stop event after each completion
+                    if stop_event and stop_event.is_set():
+                        logger.warning("Stop event detected during batch processing, halting immediately...")
+                        stopping = True
+                        # Cancel remaining futures in this batch
+                        for remaining_future in list(future_to_url.keys()):
+                            if remaining_future != future:  # Don't cancel the one we just completed
+                                remaining_future.cancel()
+                        # Clear the queue
+                        queue.clear()
+                        break
                         
-                        # Check for stop event after each completion
-                        if stop_event and stop_event.is_set():
-                            logger.warning("Stop event detected during batch processing, halting immediately...")
-                            stopping = True
-                            # Cancel remaining futures in this batch
-                            for remaining_future in list(future_to_url.keys()):
-                                if remaining_future != future:  # Don't cancel the one we just completed
-                                    remaining_future.cancel()
-                            # Clear the queue
-                            queue.clear()
-                            break
-                            
-                        # Skip processing if we're stopping
-                        if stopping:
-                            continue
-                            
-                        url, depth = future_to_url[future]
-                        self.visited.add(url)
+                    # Skip processing if we're stopping
+                    if stopping:
+                        continue
                         
-                        try:
-                            title, html_content, links = future.result()
-                            if title and html_content:
-                                success = self.save_content(url, title, html_content)
-                                if success:
-                                    self.pages_downloaded += 1
-                                    pbar.update(1)
-                                    logger.info(f"Downloaded page {self.pages_downloaded}: {url}")
-                                    logger.info(f"  Found {len(links)} links on this page")
-                                    
-                                    # Call progress callback if provided
-                                    if self.progress_callback:
-                                        total = self.max_pages # Use max_pages as total if set
-                                        self.progress_callback(url, self.pages_downloaded, total)
-                            else:
-                                logger.warning(f"No content or title for {url}")
-                        except Exception as e:
-                            logger.error(f"Error processing {url}: {e}")
+                    url, depth = future_to_url[future]
+                    self.visited.add(url)
+                    
+                    try:
+                        title, html_content, links = future.result()
+                        if title and html_content:
+                            success = self.save_content(url, title, html_content)
+                            if success:
+                                self.pages_downloaded += 1
+                                pbar.update(1)
+                                logger.info(f"Downloaded page {self.pages_downloaded}: {url}")
+                                logger.info(f"  Found {len(links)} links on this page")
+                                
+                                # Call progress callback if provided
+                                if self.progress_callback:
+                                    total = self.max_pages # Use max_pages as total if set
+                                    self.progress_callback(url, self.pages_downloaded, total)
+                        else:
+                            logger.warning(f"No content or title for {url}")
+                    except Exception as e:
+                        logger.error(f"Error processing {url}: {e}")
+                    
+                    # Only add new links if we're not stopping
+                    if depth < self.max_depth and not stopping:
+                        added_count = 0
+                        doc_links_added = 0
+                        aux_links_added = 0
                         
-                        # Only add new links if we're not stopping
-                        if depth < self.max_depth and not stopping:
-                            added_count = 0
-                            doc_links_added = 0
-                            aux_links_added = 0
-                            
-                            for link in links:
-                                # Skip if we're stopping
-                                if stopping:
-                                    break
+                        for link in links:
+                            # Skip if we're stopping
+                            if stopping:
+                                break
+                                
+                            # Full validation check with strict documentation validation
+                            if (link not in self.visited and
+                                link not in self.queued and
+                                self.is_valid_doc_url(link)):
+                                
+                                # Check if link already exists in the queue
+                                if not any(item[0] == link for item in queue):
+                                    # Check if this is a documentation or auxiliary link
+                                    is_doc_link = self._is_documentation_link(link)
                                     
-                                # Full validation check with strict documentation validation
-                                if (link not in self.visited and
-                                    link not in self.queued and
-                                    self.is_valid_doc_url(link)):
+                                    # Add to the queue and track for stats
+                                    queue.append((link, depth + 1))
+                                    self.queued.add(link)
+                                    added_count += 1
                                     
-                                    # Check if link already exists in the queue
-                                    if not any(item[0] == link for item in queue):
-                                        # Check if this is a documentation or auxiliary link
-                                        is_doc_link = self._is_documentation_link(link)
-                                        
-                                        # Add to the queue and track for stats
-                                        queue.append((link, depth + 1))
-                                        self.queued.add(link)
-                                        added_count += 1
-                                        
-                                        if is_doc_link:
-                                            doc_links_added += 1
-                                        else:
-                                            aux_links_added += 1
-                                            # Track auxiliary links for interactive mode
-                                            if should_prompt_for_aux:
-                                                aux_links_to_prompt.add(link)
-                                        
-                                        logger.debug(f"Queued new link: {link} ({'doc' if is_doc_link else 'aux'})")
-                            
-                            # Log stats about newly added links
-                            logger.info(f"Added {added_count} new links to queue from {url} ({doc_links_added} doc, {aux_links_added} aux)")
-                            logger.info(f"Queue now has {len(queue)} URLs")
-                
+                                    if is_doc_link:
+                                        doc_links_added += 1
+                                    else:
+                                        aux_links_added += 1
+                                        # Track auxiliary links for interactive mode
+                                        if should_prompt_for_aux:
+                                            aux_links_to_prompt.add(link)
+                                    
+                                    logger.debug(f"Queued new link: {link} ({'doc' if is_doc_link else 'aux'})")
+                        
+                        # Log stats about newly added links
+                        logger.info(f"Added {added_count} new links to queue from {url} ({doc_links_added} doc, {aux_links_added} aux)")
+                        logger.info(f"Queue now has {len(queue)} URLs")
+            
                 # Check for stop event before delay
                 if stop_event and stop_event.is_set():
                     logger.warning("Stop event detected before delay, halting immediately...")
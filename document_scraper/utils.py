@@ -11,10 +11,13 @@ import os
 import re
 import logging
 import time
-from typing import List, Optional, Dict, Any, Tuple, Callable, Set, Union
+from collections import Counter
+from typing import List, Optional, Dict, Any, Tuple, Callable, Set, Union, Pattern
 from urllib.parse import urlparse, urljoin, urlunparse, parse_qs, urlencode
 from slugify import slugify
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from functools import wraps
 import click
 from bs4 import BeautifulSoup
@@ -226,6 +229,32 @@ def is_same_domain(url1: str, url2: str) -> bool:
     return False
 
 
+def url_path(url: str) -> str:
+    """
+    Get the path of a URL without surrounding slashes.
+    
+    Equivalent to urlparse(url).path.strip('/') for absolute URLs, but only
+    slices the string, which matters when indexing every crawled page.
+    
+    Args:
+        url: Absolute URL
+        
+    Returns:
+        The URL path without leading or trailing slashes
+    """
+    host_start = url.find('://')
+    host_start = host_start + 3 if host_start >= 0 else 0
+    end = len(url)
+    for sep in ('?', '#'):
+        pos = url.find(sep, host_start)
+        if 0 <= pos < end:
+            end = pos
+    start = url.find('/', host_start, end)
+    if start < 0:
+        return ""
+    return url[start:end].strip('/')
+
+
 def rate_limit(min_interval: float = 0.5):
     """
     Decorator to rate limit function calls.
@@ -251,6 +280,103 @@ def rate_limit(min_interval: float = 0.5):
     return decorator
 
 
+def create_session(pool_size: int = 10, connect_retries: int = 2,
+                   status_retries: int = 0, read_retries: int = 0) -> requests.Session:
+    """
+    Create a requests session with a connection pool sized for concurrent downloads.
+    
+    By default only connection failures are retried at the adapter level; HTTP
+    errors are left to the callers' own retry loops so attempts are not
+    multiplied. Callers without such a loop can pass status_retries to have
+    429 and 5xx responses retried with backoff (honouring Retry-After), and
+    read_retries to have read timeouts and dropped connections retried. Each
+    host is capped at pool_size * 2 connections; extra requests wait for a free
+    one instead of opening throwaway connections that are never reused.
+    
+    Args:
+        pool_size: Number of keep-alive connections to hold per host
+        connect_retries: Number of times to retry establishing a connection
+        status_retries: Number of times to retry 429/5xx responses
+        read_retries: Number of times to retry reading a response
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size * 2,
+        pool_block=True,
+        max_retries=Retry(total=None, connect=connect_retries, read=read_retries or False,
+                          status=status_retries, status_forcelist=(429, 500, 502, 503, 504),
+                          backoff_factor=0.3,
+                          respect_retry_after_header=True, raise_on_status=False)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def compile_patterns(patterns: Optional[List[Union[str, Pattern]]]) -> List[Pattern]:
+    """
+    Compile filter patterns case-insensitively, passing precompiled ones through.
+    
+    Args:
+        patterns: Regex strings or already compiled patterns
+        
+    Returns:
+        List of compiled patterns
+    """
+    if not patterns:
+        return []
+    return [p if hasattr(p, "search") else re.compile(p, re.IGNORECASE) for p in patterns]
+
+
+# Numbered or named backreferences, which would point at the wrong group once combined
+_RE_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class _AnyPattern:
+    """Matcher that tries several patterns in turn, for sets that cannot be combined."""
+    
+    def __init__(self, patterns: List[Pattern]) -> None:
+        self.patterns = patterns
+    
+    def search(self, string: str) -> Optional[Any]:
+        for pattern in self.patterns:
+            match = pattern.search(string)
+            if match:
+                return match
+        return None
+
+
+def combine_patterns(patterns: List[Pattern]) -> Optional[Union[Pattern, _AnyPattern]]:
+    """
+    Combine compiled patterns into a single alternation so a check is one search call.
+    
+    Patterns that cannot be merged safely (mixed flags, backreferences, inline
+    global flags) are kept separate and tried one after another instead.
+    
+    Args:
+        patterns: Compiled patterns, e.g. from compile_patterns()
+        
+    Returns:
+        An object with a search() method matching if any pattern matches, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return patterns[0]
+    
+    flags = {p.flags for p in patterns}
+    if len(flags) == 1 and not any(_RE_BACKREFERENCE.search(p.pattern) for p in patterns):
+        try:
+            return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), flags.pop())
+        except re.error:
+            pass
+    return _AnyPattern(patterns)
+
+
 #---------------------------------------------------------------------------
 # File System Operations
 #---------------------------------------------------------------------------
@@ -573,6 +699,27 @@ def validate_url(ctx: Optional[click.Context], param: Optional[click.Parameter],
         raise click.BadParameter(f"Invalid URL: {str(e)}")
 
 
+def validate_patterns(ctx: Optional[click.Context], param: Optional[click.Parameter], value: Any) -> Tuple[Pattern, ...]:
+    """
+    Compile regex filter options once at parse time for Click commands.
+    
+    Args:
+        ctx: Click context
+        param: Click parameter
+        value: Tuple of pattern strings from a multiple option
+        
+    Returns:
+        Tuple of compiled patterns (empty if none were given)
+        
+    Raises:
+        click.BadParameter: If a pattern is not a valid regex
+    """
+    try:
+        return tuple(compile_patterns(list(value or ())))
+    except re.error as e:
+        raise click.BadParameter(f"Invalid regex pattern: {e}")
+
+
 def discover_documentation_sections(url: str, verbose: bool = False) -> Dict[str, str]:
     """
     Discover available documentation sections from a documentation website.
@@ -776,46 +923,30 @@ def analyze_documentation_structure(urls: List[str]) -> Dict[str, Any]:
     Returns:
         Dictionary with analysis results
     """
-    # Initialize structure analysis
-    analysis = {
-        'total_urls': len(urls),
-        'sections': {},
-        'depth': {},
-        'common_patterns': []
-    }
+    depth_counts = Counter()
+    section_counts = Counter()
     
-    # Extract structural information
+    # Extract structural information in a single pass over the URLs
     for url in urls:
-        parsed_url = urlparse(url)
-        path = parsed_url.path.strip('/')
+        path = urlparse(url).path.strip('/')
         
         if not path:
             # Root URL
-            analysis['depth']['root'] = analysis['depth'].get('root', 0) + 1
+            depth_counts['root'] += 1
             continue
-            
-        # Extract path segments
-        segments = path.split('/')
-        depth = len(segments)
-        
-        # Record depth
-        analysis['depth'][depth] = analysis['depth'].get(depth, 0) + 1
         
-        # Record section (first path component)
-        if segments:
-            section = segments[0]
-            analysis['sections'][section] = analysis['sections'].get(section, 0) + 1
+        # Record depth and section (first path component)
+        depth_counts[path.count('/') + 1] += 1
+        section_counts[path.partition('/')[0]] += 1
     
-    # Identify common patterns
-    common_prefixes = set()
-    for url in urls:
-        parsed_url = urlparse(url)
-        path = parsed_url.path.strip('/')
-        segments = path.split('/')
-        
-        if len(segments) >= 1:
-            common_prefixes.add(segments[0])
+    # Common patterns are the first path components, with '' standing for the root
+    common_prefixes = set(section_counts)
+    if depth_counts['root']:
+        common_prefixes.add('')
     
-    analysis['common_patterns'] = list(common_prefixes)
-    
-    return analysis
\ No newline at end of file
+    return {
+        'total_urls': len(urls),
+        'sections': dict(section_counts),
+        'depth': dict(depth_counts),
+        'common_patterns': list(common_prefixes)
+    }
\ No newline at end of file
@@ -46,6 +46,10 @@ extra_requirements = {
     'gui': [
         'tkinter>=8.6.0;python_version<"3.7"',  # tkinter is included in Python 3.7+
         'pillow>=9.0.0',  # For image handling in GUI
+        'orjson>=3.9.0',  # Faster settings serialization (json is used otherwise)
+    ],
+    'fast': [
+        'selectolax>=0.3.17',  # Lexbor-based content and link extraction (BeautifulSoup is used otherwise)
     ],
 }
 
@@ -0,0 +1,52 @@
+"""
+Tests for Markdown conversion helpers (unittest version).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import re
+import unittest
+from document_scraper.converter import _space_headings
+
+# The substitution _space_headings replaced
+HEADINGS_PATTERN = re.compile(r"(#{1,6})([^#\n\s])")
+
+class TestSpaceHeadings(unittest.TestCase):
+    SPACING_CASES = [
+        ("#Title", "# Title"),
+        ("###Section", "### Section"),
+        ("## Already spaced", "## Already spaced"),
+        ("#######Deep", "####### Deep"),
+        ("Text with C# and #tag", "Text with C# and # tag"),
+        ("Trailing #", "Trailing #"),
+        ("#\nNext line", "#\nNext line"),
+        ("No headings here", "No headings here"),
+        ("", ""),
+    ]
+
+    def test_heading_spacing(self):
+        """Test a space is added after a run of '#' only where one is missing."""
+        for text, expected in self.SPACING_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(_space_headings(text), expected)
+
+    def test_matches_regex_substitution(self):
+        """Test the scan gives the same result as the regex it replaced."""
+        samples = [text for text, _ in self.SPACING_CASES] + [
+            "#a#b##c###\t# x",
+            "########x ##y\r\n#z",
+            "```\n#include <stdio.h>\n```\n##Usage",
+            "# A\n\n##B\n###### C\n####### D",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(_space_headings(text), HEADINGS_PATTERN.sub(r"\1 \2", text))
+
+    def test_unchanged_text_is_returned_as_is(self):
+        """Test text that needs no spacing is not copied."""
+        text = "## Nothing to change"
+        self.assertIs(_space_headings(text), text)
+
+if __name__ == "__main__":
+    unittest.main()
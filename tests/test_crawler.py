@@ -0,0 +1,153 @@
+"""
+Tests for crawler link collection and browser handling (unittest version).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest import mock
+from bs4 import BeautifulSoup
+from document_scraper import crawler
+from document_scraper.crawler import (
+    _collect_link_candidates, _LINK_SELECTOR, _DOC_MENU_SELECTOR,
+    _MENU_CLICKABLE_SELECTOR, _SPA_LINK_SELECTOR
+)
+
+PAGE = """
+<html><head><title>Docs</title></head><body>
+<header><a>Home</a><a href="/">Logo</a><span class="header-link" data-url="/changelog">Changes</span></header>
+<nav class="top"><ul><li><a name="anchor">Unnamed</a></li><li><a href="/docs/start">Start</a></li></ul></nav>
+<div class="layout">
+  <aside class="sidebar docs-sidebar">
+    <div class="menu-item" data-path="/docs/one"><span class="item-label">One</span><a>Bare</a></div>
+    <div class="theme-doc-sidebar-item">
+      <a class="sidebar-link" href="/docs/two">Two</a>
+      <div class="menu-item"><span to="/docs/three">Three</span><em class="pill">new</em></div>
+    </div>
+    <button data-sidebar-item data-href="/docs/four">Four</button>
+  </aside>
+  <main>
+    <article class="prose">
+      <p>See <a href="/docs/two#usage">usage</a> and <a>nothing</a>.</p>
+      <div role="link" data-href="/docs/five">Five</div>
+      <span data-testid="nav-next" to="/docs/six">Next</span>
+      <a class="MuiLink-root chakra-link" href="https://other.org/">Other</a>
+    </article>
+    <div data-type="link"><i class="icon-link"></i><b data-target="/docs/seven">Seven</b></div>
+    <ol class="page-toc"><li class="toc-item"><a href="#section">Section</a></li></ol>
+    <div data-menu-id="m1"><div class="section-nav"><a href="/docs/eight">Eight</a></div></div>
+  </main>
+</div>
+<footer><a href="mailto:docs@example.com">Mail</a><p><a>Footer</a></p></footer>
+</body></html>
+"""
+
+
+def _normalize(attrs):
+    """Attributes as a hashable tuple, as the HTML spells them.
+    
+    BeautifulSoup splits class lists and Lexbor reports valueless attributes as None.
+    """
+    return tuple(sorted((key, ' '.join(value) if isinstance(value, list) else value or '')
+                        for key, value in attrs.items()))
+
+
+def _unique(elements):
+    """Attributes of each element once, in first-seen order."""
+    seen = set()
+    result = []
+    for element in elements:
+        if id(element) not in seen:
+            seen.add(id(element))
+            result.append(_normalize(element.attrs))
+    return result
+
+
+class TestCollectLinkCandidates(unittest.TestCase):
+    def setUp(self):
+        soup = BeautifulSoup(PAGE, 'html.parser')
+        # The per-selector queries the single walk replaces
+        self.expected_links = _unique(soup.select(_LINK_SELECTOR))
+        self.expected_clickables = _unique(
+            element
+            for menu_item in soup.select(_DOC_MENU_SELECTOR)
+            for element in menu_item.select(_MENU_CLICKABLE_SELECTOR)
+        )
+        self.expected_spa = _unique(soup.select(_SPA_LINK_SELECTOR))
+
+    def assertCandidates(self, soup):
+        """Check each candidate list matches its selector query, in document order."""
+        links, clickables, spa = _collect_link_candidates(soup)
+        for name, actual, expected in [
+            ("links", links, self.expected_links),
+            ("clickables", clickables, self.expected_clickables),
+            ("spa", spa, self.expected_spa),
+        ]:
+            with self.subTest(candidates=name):
+                self.assertTrue(expected)
+                self.assertEqual([_normalize(attrs) for attrs in actual], expected)
+
+    def test_beautifulsoup_walk_matches_select(self):
+        """Test the single tree walk returns what the per-selector select() calls did."""
+        for parser in ('html.parser', 'lxml'):
+            with self.subTest(parser=parser):
+                self.assertCandidates(BeautifulSoup(PAGE, parser))
+
+    @unittest.skipUnless(crawler.SELECTOLAX_AVAILABLE, "selectolax is not installed")
+    def test_lexbor_queries_match_select(self):
+        """Test the selectolax path returns the same candidates."""
+        self.assertCandidates(crawler.LexborHTMLParser(PAGE))
+
+
+class _SeleniumError(Exception):
+    """Stand-in for the Selenium exception classes."""
+
+
+class TestBrowserCleanup(unittest.TestCase):
+    def setUp(self):
+        # Stub Selenium so browser mode runs without Chrome; each Chrome() call is a new driver
+        self.drivers = []
+        self.chrome = mock.MagicMock(side_effect=self._new_driver)
+        patches = [
+            mock.patch.object(crawler, 'SELENIUM_AVAILABLE', True),
+            mock.patch.object(crawler, 'webdriver', mock.MagicMock(Chrome=self.chrome), create=True),
+            mock.patch.object(crawler.Crawler, '_chromedriver_path', 'chromedriver'),
+        ]
+        for name in ('Options', 'Service', 'ChromeDriverManager', 'By', 'WebDriverWait', 'EC'):
+            patches.append(mock.patch.object(crawler, name, mock.MagicMock(), create=True))
+        for name in ('TimeoutException', 'WebDriverException'):
+            patches.append(mock.patch.object(crawler, name, _SeleniumError, create=True))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.crawler = crawler.Crawler('https://docs.example.com/', browser_mode=True)
+
+    def _new_driver(self, **kwargs):
+        """Stand-in for webdriver.Chrome that records the drivers it returns."""
+        driver = mock.MagicMock(page_source=PAGE)
+        self.drivers.append(driver)
+        return driver
+
+    def test_standalone_download_quits_driver(self):
+        """Test download_url outside crawl() closes the browser it started."""
+        html_content, links = self.crawler.download_url('https://docs.example.com/docs/')
+        self.assertEqual(html_content, PAGE)
+        self.assertIn('https://docs.example.com/docs/start', links['doc'])
+        self.assertEqual(len(self.drivers), 1)
+        self.drivers[0].quit.assert_called_once_with()
+        self.assertEqual(self.crawler.active_browser_instances, [])
+
+    def test_crawl_reuses_driver_until_cleanup(self):
+        """Test pages fetched during a crawl share one browser, closed by the crawl's cleanup."""
+        self.crawler._in_crawl = True
+        self.crawler.download_url('https://docs.example.com/docs/')
+        self.crawler.download_url('https://docs.example.com/docs/start')
+        self.assertEqual(len(self.drivers), 1)
+        self.drivers[0].quit.assert_not_called()
+        
+        self.crawler._cleanup_browser_instances()
+        self.drivers[0].quit.assert_called_once_with()
+
+if __name__ == "__main__":
+    unittest.main()
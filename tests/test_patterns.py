@@ -0,0 +1,90 @@
+"""
+Tests for filter pattern utilities (unittest version).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import re
+import unittest
+from document_scraper.utils import compile_patterns, combine_patterns
+
+class TestCombinePatterns(unittest.TestCase):
+    # Strings checked against each combined matcher and its individual patterns
+    SAMPLES = [
+        "https://example.com/docs/intro",
+        "https://example.com/API/v2",
+        "https://example.com/blog/2024/post",
+        "https://example.com/aa/bb",
+        "https://example.com/abab",
+        "https://example.com/x-x",
+        "https://example.com/pricing",
+        "",
+    ]
+
+    def assertMatchesAny(self, matcher, patterns):
+        """Check the matcher agrees with searching each pattern in turn."""
+        for sample in self.SAMPLES:
+            with self.subTest(sample=sample):
+                expected = any(p.search(sample) for p in patterns)
+                self.assertEqual(bool(matcher.search(sample)), expected)
+
+    def test_empty_list(self):
+        """Test no patterns give no matcher."""
+        self.assertIsNone(combine_patterns([]))
+        self.assertIsNone(combine_patterns(compile_patterns(None)))
+
+    def test_single_pattern_returned_as_is(self):
+        """Test a single pattern is used directly."""
+        pattern = re.compile(r"/docs/")
+        self.assertIs(combine_patterns([pattern]), pattern)
+
+    def test_same_flags_combined(self):
+        """Test patterns sharing flags become one alternation."""
+        patterns = compile_patterns([r"/docs/", r"/api/", r"\d{4}/"])
+        matcher = combine_patterns(patterns)
+        self.assertIsInstance(matcher, re.Pattern)
+        self.assertEqual(matcher.flags, patterns[0].flags)
+        self.assertMatchesAny(matcher, patterns)
+
+    def test_mixed_flags_kept_separate(self):
+        """Test patterns with different flags keep their own flags."""
+        patterns = [re.compile(r"/api/"), re.compile(r"/docs/", re.IGNORECASE)]
+        matcher = combine_patterns(patterns)
+        self.assertNotIsInstance(matcher, re.Pattern)
+        self.assertMatchesAny(matcher, patterns)
+        # Only the case-insensitive pattern may match a different case
+        self.assertIsNone(matcher.search("https://example.com/API/v2"))
+
+    def test_numbered_backreference_kept_separate(self):
+        """Test numbered backreferences are not renumbered by merging."""
+        patterns = compile_patterns([r"/docs/", r"/(\w)\1/"])
+        matcher = combine_patterns(patterns)
+        self.assertNotIsInstance(matcher, re.Pattern)
+        self.assertMatchesAny(matcher, patterns)
+
+    def test_named_backreference_kept_separate(self):
+        """Test named backreferences are left to their own pattern."""
+        patterns = compile_patterns([r"/(?P<c>\w)-(?P=c)", r"/docs/"])
+        matcher = combine_patterns(patterns)
+        self.assertNotIsInstance(matcher, re.Pattern)
+        self.assertMatchesAny(matcher, patterns)
+
+    def test_duplicate_group_names_fall_back(self):
+        """Test patterns that cannot compile together are tried one by one."""
+        patterns = compile_patterns([r"/(?P<section>docs)/", r"/(?P<section>blog)/"])
+        matcher = combine_patterns(patterns)
+        self.assertNotIsInstance(matcher, re.Pattern)
+        self.assertMatchesAny(matcher, patterns)
+
+    def test_precompiled_input(self):
+        """Test precompiled patterns pass through compile_patterns unchanged."""
+        precompiled = re.compile(r"/Docs/")  # Case-sensitive, unlike compiled strings
+        patterns = compile_patterns([precompiled, r"/pricing"])
+        self.assertIs(patterns[0], precompiled)
+        matcher = combine_patterns(patterns)
+        self.assertMatchesAny(matcher, patterns)
+        self.assertIsNone(matcher.search("https://example.com/docs/intro"))
+
+if __name__ == "__main__":
+    unittest.main()
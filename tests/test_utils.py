@@ -0,0 +1,39 @@
+"""
+Tests for URL utilities (unittest version).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from urllib.parse import urlparse
+from document_scraper.utils import url_path
+
+class TestUrlPath(unittest.TestCase):
+    PATH_CASES = [
+        ("https://example.com", ""),
+        ("https://example.com/", ""),
+        ("https://example.com/docs/intro/", "docs/intro"),
+        ("https://example.com//docs//", "docs"),
+        ("https://example.com/docs/page.html?q=1/2", "docs/page.html"),
+        ("https://example.com/docs#section/one", "docs"),
+        ("https://example.com?next=/docs", ""),
+        ("https://example.com#/docs", ""),
+        ("http://localhost:8000/api/v1/", "api/v1"),
+        ("https://user:pw@example.com/a/b?x#y", "a/b"),
+    ]
+
+    def test_url_paths(self):
+        """Test the path is returned without surrounding slashes."""
+        for url, expected in self.PATH_CASES:
+            with self.subTest(url=url):
+                self.assertEqual(url_path(url), expected)
+
+    def test_matches_urlparse(self):
+        """Test the result matches urlparse for absolute URLs."""
+        for url, _ in self.PATH_CASES:
+            with self.subTest(url=url):
+                self.assertEqual(url_path(url), urlparse(url).path.strip('/'))
+
+if __name__ == "__main__":
+    unittest.main()